@@ -22,10 +22,13 @@ class UserManager(BaseUserManager):
         return self.create_user(email, password, **extra_fields)
 
 class User(AbstractBaseUser, PermissionsMixin):
+    ROLE_MARKETING = 'MARKETING'
+    ROLE_SUPERADMIN = 'SUPERADMIN'
+    ROLE_CUSTOMER = 'CUSTOMER'
     ROLE_CHOICES = [
-        ('MARKETING', 'Marketing Team'),
-        ('SUPERADMIN', 'Super Admin'),
-        ('CUSTOMER', 'Customer'),
+        (ROLE_MARKETING, 'Marketing Team'),
+        (ROLE_SUPERADMIN, 'Super Admin'),
+        (ROLE_CUSTOMER, 'Customer'),
     ]
     
     email = models.EmailField(unique=True)
@@ -57,6 +60,9 @@ class User(AbstractBaseUser, PermissionsMixin):
     
     class Meta:
         db_table = 'users'
+        indexes = [
+            models.Index(fields=['role', 'is_approved', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
@@ -76,6 +82,13 @@ class User(AbstractBaseUser, PermissionsMixin):
         self.customer_code = code
         return code
     
+    def employee_id_base(self):
+        """Employee ID prefix (initials, joining month and year) that the serial number follows"""
+        first_initial = (self.first_name[:1] or 'X').upper()
+        last_initial = (self.last_name[:1] or 'X').upper()
+        joined = self.date_joined or timezone.now()
+        return f"{first_initial}{joined:%m}{last_initial}{joined:%y}"
+
     def generate_employee_id(self):
         """
         Generate Employee ID: First Name Initial + Joining Month + Last Name Initial + Year (YY) + Serial No
@@ -84,13 +97,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         if self.employee_id:
             return self.employee_id
 
-        first_initial = (self.first_name[:1] or 'X').upper()
-        last_initial = (self.last_name[:1] or 'X').upper()
-        join_month = (self.date_joined or timezone.now()).strftime('%m')
-        join_year = (self.date_joined or timezone.now()).strftime('%y')
-        
         # Get serial number based on same month/year registrations
-        base_id = f"{first_initial}{join_month}{last_initial}{join_year}"
+        base_id = self.employee_id_base()
         
         # Find the highest serial number for this base ID
         existing_users = User.objects.filter(
@@ -120,9 +128,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.is_approved and self.is_active and not self.is_deleted
     
     def save(self, *args, **kwargs):
+        # Store roles upper-case so checks can compare against ROLE_* directly.
+        self.role = (self.role or '').upper()
         if not self.employee_id and self.is_approved:
             self.generate_employee_id()
-        if not self.customer_code and getattr(self, 'role', '').upper() == 'CUSTOMER':
+        if not self.customer_code and self.role == self.ROLE_CUSTOMER:
             self.generate_customer_code()
         super().save(*args, **kwargs)
         
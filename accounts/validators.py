@@ -2,9 +2,15 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext as _
 import re
 
+# Compiled once at import and shared by every form that validates these values.
+_SYMBOL_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+_LETTER_RE = re.compile(r'[A-Za-z]')
+_DIGIT_RE = re.compile(r'\d')
+_WHATSAPP_RE = re.compile(r'^\d{10}$')
+
 class SymbolValidator:
     def validate(self, password, user=None):
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if not _SYMBOL_RE.search(password):
             raise ValidationError(
                 _("Password must contain at least one special character."),
                 code='password_no_symbol',
@@ -15,7 +21,7 @@ class SymbolValidator:
 
 def validate_whatsapp_number(value):
     """Validate WhatsApp number format (10 digits after country code)"""
-    if not re.match(r'^\d{10}$', value):
+    if not _WHATSAPP_RE.match(value):
         raise ValidationError('WhatsApp number must be exactly 10 digits.')
 
 def validate_name_length(value, field_name="Name"):
@@ -33,17 +39,17 @@ class PasswordComplexityValidator:
     """
     
     def validate(self, password, user=None):
-        if not re.search(r'[A-Za-z]', password):
+        if not _LETTER_RE.search(password):
             raise ValidationError(
                 _("Password must contain at least one letter."),
                 code='password_no_letter',
             )
-        if not re.search(r'\d', password):
+        if not _DIGIT_RE.search(password):
             raise ValidationError(
                 _("Password must contain at least one number."),
                 code='password_no_number',
             )
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if not _SYMBOL_RE.search(password):
             raise ValidationError(
                 _("Password must contain at least one special character."),
                 code='password_no_special',
@@ -362,6 +362,8 @@ def profile_update_approval_list(request):
         requests_qs = ProfileUpdateRequest.objects.filter(status='REJECTED')
     else:
         requests_qs = ProfileUpdateRequest.objects.all()
+    # The table renders each requester's name and current profile picture.
+    requests_qs = requests_qs.select_related('user', 'user__profile')
         
     # Base queryset
     requests = ProfileUpdateRequest.objects.all()
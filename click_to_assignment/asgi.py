@@ -10,7 +10,13 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 import os
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'click_to_assignment.settings')
 
 application = get_asgi_application()
+
+# Build the root resolver's reverse lookup tables while the worker boots, so
+# the first request does not pay for them. Done here rather than in an
+# AppConfig.ready() so management commands never import the URLconf.
+get_resolver().reverse_dict
@@ -1,3 +1,5 @@
+import importlib.util
+import logging
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -215,6 +217,23 @@ OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 SESSION_COOKIE_AGE = 86400  # 24 hours
 SESSION_SAVE_EVERY_REQUEST = True
 
+# Seconds that cached read-only report pages (statistics, analytics) are reused
+VIEW_CACHE_TIMEOUT = int(os.getenv('VIEW_CACHE_TIMEOUT', 60))
+
+
+# Surface lazy-loaded relations (N+1 queries) during local development when
+# nplusone is installed; it is not a production dependency.
+if DEBUG and importlib.util.find_spec('nplusone'):
+    INSTALLED_APPS.append('nplusone.ext.django')
+    MIDDLEWARE.insert(0, 'nplusone.ext.django.NPlusOneMiddleware')
+    NPLUSONE_LOGGER = logging.getLogger('nplusone')
+    NPLUSONE_LOG_LEVEL = logging.WARN
+    LOGGING = {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'handlers': {'console': {'class': 'logging.StreamHandler'}},
+        'loggers': {'nplusone': {'handlers': ['console'], 'level': 'WARN'}},
+    }
 
 if not DEBUG:
     SECURE_SSL_REDIRECT = True
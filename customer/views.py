@@ -4,7 +4,6 @@ from django.contrib.auth import update_session_auth_hash
 from django.shortcuts import render, redirect, get_object_or_404
 from django.core.paginator import Paginator
 from django.conf import settings
-from profiles.models import Profile
 from django.utils import timezone
 from datetime import timedelta
 from django.db.models import Max
@@ -28,7 +27,6 @@ from superadmin.models import (
     PricingPlan,
     PricingPlanPurchase,
     StructureGenerationSubmission,
-    _generate_bigint_id,
     SystemSettings,
 )
 from tickets.models import CustomerTicket
@@ -63,35 +61,30 @@ def _debit_wallet(user, amount: int, source: str, related_type: str = '', relate
     if amount > 0 and (wallet.balance or 0) < amount:
         return False, wallet, None
 
-    before_balance = wallet.balance or 0
     if amount > 0:
-        wallet.balance = before_balance - amount
-        wallet.save(update_fields=['balance', 'last_updated_at'])
-        # Credit the SuperAdmin wallet with the same amount
-        try:
-            admin_wallet = AdminWallet.get_solo()
-            admin_wallet.balance = (admin_wallet.balance or 0) + amount
-            admin_wallet.save(update_fields=['balance', 'updated_at'])
-            settings_obj = SystemSettings.get_solo()
-            settings_obj.admin_coin_balance = (settings_obj.admin_coin_balance or 0) + amount
-            settings_obj.save(update_fields=['admin_coin_balance', 'updated_at'])
-        except Exception:
-            logger.warning("Failed to credit AdminWallet for debit of %s coins", amount)
-        txn = CoinTransaction.objects.create(
-            txn_id=f"TXN{_generate_bigint_id()}",
-            wallet=wallet,
-            customer=user,
+        txn = wallet.apply_transaction(
             txn_type=CoinTransaction.TYPE_DEBIT,
             amount=amount,
-            before_balance=before_balance,
-            after_balance=wallet.balance,
             source=source,
+            customer=user,
             related_object_type=related_type,
             related_object_id=str(related_id) if related_id else '',
             reason=reason,
             created_by_role=getattr(user, 'role', 'CUSTOMER'),
             created_by_id=user,
         )
+        if txn is None:
+            # Balance dropped below amount since the check above.
+            return False, wallet, None
+        # Credit the SuperAdmin wallet with the same amount
+        try:
+            admin_wallet = AdminWallet.get_solo(cached=False)
+            admin_wallet.credit(amount)
+            settings_obj = SystemSettings.get_solo(cached=False)
+            settings_obj.admin_coin_balance = admin_wallet.balance
+            settings_obj.save(update_fields=['admin_coin_balance', 'updated_at'])
+        except Exception:
+            logger.warning("Failed to credit AdminWallet for debit of %s coins", amount)
         # Notify customer of deduction
         try:
             create_notification(
@@ -118,18 +111,11 @@ def _credit_wallet(user, amount: int, source: str, related_type: str = '', relat
     amount = int(amount or 0)
     if amount <= 0:
         return wallet, None
-    before_balance = wallet.balance or 0
-    wallet.balance = before_balance + amount
-    wallet.save(update_fields=['balance', 'last_updated_at'])
-    txn = CoinTransaction.objects.create(
-        txn_id=f"TXN{_generate_bigint_id()}",
-        wallet=wallet,
-        customer=user,
+    txn = wallet.apply_transaction(
         txn_type=CoinTransaction.TYPE_CREDIT,
         amount=amount,
-        before_balance=before_balance,
-        after_balance=wallet.balance,
         source=source,
+        customer=user,
         related_object_type=related_type,
         related_object_id=str(related_id) if related_id else '',
         reason=reason,
@@ -299,9 +285,11 @@ def _base_context(request):
         except Exception:
             name = getattr(profile.profile_image, 'name', '')
             img_url = settings.MEDIA_URL + name if name else ''
-    elif hasattr(request.user, 'profile'):
+    else:
         try:
-            prof = Profile.objects.filter(user=request.user).first()
+            # Single lookup through the reverse accessor (cached on request.user);
+            # hasattr() + a second filter() used to query the profile twice.
+            prof = getattr(request.user, 'profile', None)
             if prof and prof.profile_picture:
                 img_url = prof.profile_picture.url
         except Exception:
@@ -831,9 +819,9 @@ def dashboard_view(request):
             'is_task': False,
         })
     for src, label, coins_field, topic_field in [
-        (JobCheckingSubmission.objects.filter(user=user).order_by('-created_at')[:20], 'Job Checking', 'coins_spent', 'instruction'),
-        (StructureGenerationSubmission.objects.filter(user=user).order_by('-created_at')[:20], 'Structure Generate', 'coins_spent', 'topic'),
-        (ContentGenerationSubmission.objects.filter(user=user).order_by('-created_at')[:20], 'Content Creation', 'coins_spent', 'topic'),
+        (JobCheckingSubmission.objects.list_qs().filter(user=user).order_by('-created_at')[:20], 'Job Checking', 'coins_spent', 'instruction'),
+        (StructureGenerationSubmission.objects.list_qs().filter(user=user).order_by('-created_at')[:20], 'Structure Generate', 'coins_spent', 'topic'),
+        (ContentGenerationSubmission.objects.list_qs().filter(user=user).order_by('-created_at')[:20], 'Content Creation', 'coins_spent', 'topic'),
     ]:
         for item in src:
             activities.append({
@@ -952,8 +940,8 @@ def job_checking_view(request):
             messages.error(request, 'Could not save submission. Please try again.')
         return redirect('customer:job_checking')
 
-    recent_checks = JobCheckingSubmission.objects.filter(user=request.user).order_by('-created_at')[:10]
-    checks_paginator = Paginator(JobCheckingSubmission.objects.filter(user=request.user).order_by('-created_at'), 5)
+    recent_checks = JobCheckingSubmission.objects.list_qs().filter(user=request.user).order_by('-created_at')[:10]
+    checks_paginator = Paginator(JobCheckingSubmission.objects.list_qs().filter(user=request.user).order_by('-created_at'), 5)
     checks_page_number = request.GET.get('rc_page') or 1
     checks_page_obj = checks_paginator.get_page(checks_page_number)
     ctx.update({
@@ -1034,7 +1022,7 @@ def structure_generate_view(request):
         return redirect('customer:structure_generate')
 
     # Recent submissions with pagination
-    structures_qs = StructureGenerationSubmission.objects.filter(user=request.user).order_by('-created_at')
+    structures_qs = StructureGenerationSubmission.objects.list_qs().filter(user=request.user).order_by('-created_at')
     struct_page = Paginator(structures_qs, 5).get_page(request.GET.get('sg_page') or 1)
     structure_cost = ctx.get('structure_cost', 0)
     ctx.update({
@@ -1199,14 +1187,13 @@ def coin_history_view(request):
 def pricing_plan_view(request):
     ctx = _base_context(request)
     plans = list(PricingPlan.objects.filter(status=PricingPlan.STATUS_PUBLISHED).order_by('price', 'name'))
-    purchases = list(PricingPlanPurchase.objects.filter(user=request.user).order_by('-purchased_at')[:20])
+    purchases = list(PricingPlanPurchase.objects.list_qs().filter(user=request.user).order_by('-purchased_at')[:20])
 
     # Refresh purchase status for expiry
     now = timezone.now()
     for purchase in purchases:
         if purchase.valid_until and purchase.valid_until < now and purchase.status != PricingPlanPurchase.STATUS_EXPIRED:
-            purchase.status = PricingPlanPurchase.STATUS_EXPIRED
-            purchase.save(update_fields=['status'])
+            purchase.mark_expired()
 
     if request.method == 'POST':
         if getattr(request.user, 'role', '').upper() != 'CUSTOMER':
@@ -1218,19 +1205,11 @@ def pricing_plan_view(request):
             messages.error(request, 'Plan not found or no longer available.')
         else:
             wallet, _ = CoinWallet.objects.get_or_create(user=request.user, defaults={'balance': ctx.get('coin_balance', 0)})
-            before_balance = wallet.balance
-            wallet.balance = (before_balance or 0) + plan.coin_amount
-            wallet.save(update_fields=['balance', 'last_updated_at'])
-
-            txn = CoinTransaction.objects.create(
-                txn_id=f"TXN{_generate_bigint_id()}",
-                wallet=wallet,
-                customer=request.user,
+            txn = wallet.apply_transaction(
                 txn_type=CoinTransaction.TYPE_CREDIT,
                 amount=plan.coin_amount,
-                before_balance=before_balance or 0,
-                after_balance=wallet.balance,
                 source=CoinTransaction.SOURCE_PURCHASE,
+                customer=request.user,
                 related_object_type='PricingPlan',
                 related_object_id=str(plan.pk),
                 reason=f"Purchase of plan {plan.name}",
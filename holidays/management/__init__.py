@@ -0,0 +1 @@
+# Package initializer for holidays management commands
@@ -0,0 +1,26 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from holidays.models import Holiday
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Store role_targets for holidays saved before that column existed."
+
+    def handle(self, *args, **options):
+        updated = 0
+
+        for holiday in Holiday.objects.only('id', 'applies_to', 'role_targets').iterator():
+            role_targets = Holiday.parse_role_targets(holiday.applies_to)
+            if holiday.role_targets == role_targets:
+                continue
+            Holiday.objects.filter(pk=holiday.pk).update(role_targets=role_targets)
+            updated += 1
+
+        msg = f"Backfilled holiday role targets: {updated}"
+        self.stdout.write(self.style.SUCCESS(msg))
+        logger.info(msg)
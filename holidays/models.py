@@ -28,6 +28,8 @@ class Holiday(models.Model):
         default=TEAM_ALL,
         help_text='Comma separated list of teams (MARKETING,SUPERADMIN) or ALL'
     )
+    # Upper-cased roles parsed from applies_to on save; empty when it applies to ALL.
+    role_targets = models.JSONField(default=list, blank=True, editable=False)
     notes = models.TextField(blank=True, null=True)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -45,6 +47,20 @@ class Holiday(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.role_targets = self.parse_role_targets(self.applies_to)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'applies_to' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'role_targets'}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def parse_role_targets(cls, applies_to):
+        applies = (applies_to or '').upper()
+        if not applies or applies == cls.TEAM_ALL:
+            return []
+        return [role.strip() for role in applies.split(',') if role.strip()]
+
     def applies_to_list(self):
         if not self.applies_to or self.applies_to == self.TEAM_ALL:
             return ['All Teams']
@@ -101,6 +101,7 @@ class Job(models.Model):
             models.Index(fields=['job_id']),
             models.Index(fields=['system_id']),
             models.Index(fields=['status']),
+            models.Index(fields=['is_approved']),
             models.Index(fields=['-created_at']),
         ]
     
@@ -6,7 +6,7 @@ from django.utils import timezone
 from holidays.models import Holiday
 from jobs.models import Job
 from notifications.models import Notification
-from notifications.utils import create_notification
+from notifications.utils import create_notifications_bulk
 
 
 def _holiday_dates_between(start, end):
@@ -41,6 +41,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         today = timezone.localdate()
+        pending = []
         upcoming = Job.objects.filter(expected_deadline__isnull=False).exclude(status__in=['COMPLETED', 'APPROVED'])
         for job in upcoming:
             deadline = timezone.localtime(job.expected_deadline).date()
@@ -57,23 +58,25 @@ class Command(BaseCommand):
             if existing:
                 continue
 
-            message = f'Deadline approaching for job {job.job_id} on {deadline.strftime(\"%b %d\")} (working days left: {working_days}).'
+            message = f'Deadline approaching for job {job.job_id} on {deadline.strftime("%b %d")} (working days left: {working_days}).'
             url = ''
             if job.created_by_id:
-                create_notification(
-                    title='Deadline Reminder',
-                    message=message,
-                    url=url,
-                    users=[job.created_by],
-                    related_model='JobDeadline',
-                    related_object_id=str(job.id),
-                )
-            create_notification(
-                title='Deadline Reminder',
-                message=message,
-                url=url,
-                role_target=Notification.ROLE_SUPERADMIN,
-                related_model='JobDeadline',
-                related_object_id=str(job.id),
-            )
+                pending.append({
+                    'title': 'Deadline Reminder',
+                    'message': message,
+                    'url': url,
+                    'users': [job.created_by_id],
+                    'related_model': 'JobDeadline',
+                    'related_object_id': str(job.id),
+                })
+            pending.append({
+                'title': 'Deadline Reminder',
+                'message': message,
+                'url': url,
+                'role_target': Notification.ROLE_SUPERADMIN,
+                'related_model': 'JobDeadline',
+                'related_object_id': str(job.id),
+            })
+        if pending:
+            create_notifications_bulk(pending)
         self.stdout.write(self.style.SUCCESS('Deadline notifications checked.'))
@@ -2,6 +2,8 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+from superadmin.models import _generate_bigint_id
+
 
 class Notification(models.Model):
     ROLE_MARKETING = 'MARKETING'
@@ -34,6 +36,13 @@ class Notification(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # Keys are assigned client-side so recipient rows can be built before
+        # the notification INSERT completes.
+        if not self.pk:
+            self.pk = _generate_bigint_id()
+        super().save(*args, **kwargs)
+
 
 class NotificationRecipient(models.Model):
     notification = models.ForeignKey(
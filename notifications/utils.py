@@ -5,46 +5,89 @@ from django.db import transaction
 from django.urls import reverse
 
 from notifications.models import Notification, NotificationRecipient
+from superadmin.models import _generate_bigint_id
 from superadmin.models import Announcement
 from holidays.models import Holiday
 
 User = get_user_model()
 
 
-def _create_recipients(notification, users: Iterable[User]):
+# Recipient rows are inserted in chunks so a large fan-out never builds a single
+# oversized INSERT.
+RECIPIENT_BULK_BATCH_SIZE = 10000
+
+
+def _recipient_user_ids(item, role_user_ids):
+    """
+    Resolve the set of user ids a notification item fans out to. Role lookups
+    are memoised in ``role_user_ids`` so a batch only queries each role once.
+    """
+    user_ids = {getattr(user, 'pk', user) for user in (item.get('users') or [])}
+    role_target = item.get('role_target')
+    if role_target in (Notification.ROLE_MARKETING, Notification.ROLE_SUPERADMIN, Notification.ROLE_ALL):
+        if role_target not in role_user_ids:
+            qs = User.objects.all() if role_target == Notification.ROLE_ALL else User.objects.filter(role=role_target)
+            role_user_ids[role_target] = set(qs.values_list('pk', flat=True))
+        user_ids.update(role_user_ids[role_target])
+
+    user_target = item.get('user_target')
+    if user_target:
+        user_ids.add(user_target.pk)
+    return user_ids
+
+
+@transaction.atomic
+def create_notifications_bulk(items):
+    """
+    Create many notifications at once. Each item is a dict accepting the same
+    keyword arguments as ``create_notification``. All recipient rows across
+    the batch are written with chunked ``bulk_create`` calls instead of one
+    round-trip per notification.
+    """
+    items = list(items)
+    notifications = [
+        Notification(
+            pk=_generate_bigint_id(),
+            title=item['title'],
+            message=item.get('message', ''),
+            url=item.get('url', ''),
+            role_target=item.get('role_target'),
+            user_target=item.get('user_target'),
+            related_model=item.get('related_model', ''),
+            related_object_id=item.get('related_object_id', ''),
+        )
+        for item in items
+    ]
+    # Primary keys are generated client-side (see Notification.save), so the
+    # recipient rows can reference them before either INSERT is issued.
+    role_user_ids = {}
     recipients = [
-        NotificationRecipient(notification=notification, user=user)
-        for user in users
+        NotificationRecipient(notification_id=notification.pk, user_id=user_id)
+        for notification, item in zip(notifications, items)
+        for user_id in _recipient_user_ids(item, role_user_ids)
     ]
-    NotificationRecipient.objects.bulk_create(recipients, ignore_conflicts=True)
+    Notification.objects.bulk_create(notifications)
+    NotificationRecipient.objects.bulk_create(
+        recipients,
+        batch_size=RECIPIENT_BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    return notifications
 
 
-@transaction.atomic
 def create_notification(*, title: str, message: str = '', url: str = '', role_target: Optional[str] = None,
                         users: Optional[Iterable[User]] = None, related_model: str = '', related_object_id: str = '',
                         user_target: Optional[User] = None):
-    notification = Notification.objects.create(
-        title=title,
-        message=message,
-        url=url,
-        role_target=role_target,
-        user_target=user_target,
-        related_model=related_model,
-        related_object_id=related_object_id,
-    )
-
-    recipient_users = set(users or [])
-    if role_target in (Notification.ROLE_MARKETING, Notification.ROLE_SUPERADMIN):
-        qs = User.objects.filter(role=role_target)
-        recipient_users.update(qs)
-    elif role_target == Notification.ROLE_ALL:
-        recipient_users.update(User.objects.all())
-
-    if user_target:
-        recipient_users.add(user_target)
-
-    _create_recipients(notification, recipient_users)
-    return notification
+    return create_notifications_bulk([{
+        'title': title,
+        'message': message,
+        'url': url,
+        'role_target': role_target,
+        'users': users,
+        'user_target': user_target,
+        'related_model': related_model,
+        'related_object_id': related_object_id,
+    }])[0]
 
 
 def notify_superadmins_new_job(job):
@@ -110,11 +153,13 @@ def notify_announcement_created(announcement):
 
 
 def notify_holiday_created(holiday):
-    applies = (holiday.applies_to or '').upper()
-    role_target = Notification.ROLE_ALL if applies == 'ALL' else None
+    role_target = Notification.ROLE_ALL if (holiday.applies_to or '').upper() == Holiday.TEAM_ALL else None
     users = None
-    if applies and applies != 'ALL':
-        users = User.objects.filter(role__in=[role.strip().upper() for role in applies.split(',') if role.strip()])
+    # Rows saved before role_targets existed hold [] until backfilled
+    # (manage.py backfill_holiday_role_targets); parse applies_to for them.
+    role_targets = holiday.role_targets or Holiday.parse_role_targets(holiday.applies_to)
+    if role_targets:
+        users = User.objects.filter(role__in=role_targets).values_list('pk', flat=True)
     create_notification(
         title=f'Holiday: {holiday.title}',
         message=holiday.notes or holiday.title,
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PermissionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'permissions'
+
+    def ready(self):
+        import permissions.signals
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Permission, RolePermission
+from .utils import invalidate_permission_stats
+
+
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+def clear_permission_stats(sender, **kwargs):
+    """Drop cached permission management stats when permissions change"""
+    invalidate_permission_stats()
@@ -2,42 +2,82 @@ from functools import wraps
 
 from django.conf import settings
 from django.contrib import messages
+from django.core.cache import cache
 from django.shortcuts import redirect
 
 from permissions.defaults import DEFAULT_PERMISSIONS, ROLE_DEFAULTS
 from permissions.models import Permission, RolePermission
 
 
+PERMISSION_STATS_CACHE_KEY = 'permissions:management_stats'
+# Short, because the per-process default cache is only flushed in the worker
+# that saved the permission change.
+PERMISSION_STATS_CACHE_TIMEOUT = 30
+
+
 def ensure_default_permissions():
+    # Only write rows whose values actually differ so unchanged defaults do not
+    # fire post_save (and flush the cached stats) on every call.
     for code, name, desc in DEFAULT_PERMISSIONS:
-        permission, _ = Permission.objects.update_or_create(
+        permission, created = Permission.objects.get_or_create(
             code=code,
             defaults={'name': name, 'description': desc},
         )
+        if not created and (permission.name, permission.description) != (name, desc):
+            permission.name = name
+            permission.description = desc
+            permission.save(update_fields=['name', 'description'])
         for role, _ in RolePermission.ROLE_CHOICES:
             default_matrix = ROLE_DEFAULTS.get(role)
             if default_matrix == 'ALL':
-                RolePermission.objects.update_or_create(
-                    permission=permission,
-                    role=role,
-                    defaults={'is_allowed': True},
-                )
+                should_allow = True
             elif isinstance(default_matrix, set):
                 should_allow = code in default_matrix
-                RolePermission.objects.update_or_create(
-                    permission=permission,
-                    role=role,
-                    defaults={'is_allowed': should_allow},
-                )
             else:
                 RolePermission.objects.get_or_create(
                     permission=permission,
                     role=role,
                 )
+                continue
+            rp, created = RolePermission.objects.get_or_create(
+                permission=permission,
+                role=role,
+                defaults={'is_allowed': should_allow},
+            )
+            if not created and rp.is_allowed != should_allow:
+                rp.is_allowed = should_allow
+                rp.save(update_fields=['is_allowed'])
 
     RolePermission.objects.filter(role=RolePermission.ROLE_SUPERADMIN).update(is_allowed=True)
 
 
+def _compute_permission_stats():
+    # Djongo struggles with boolean filters inside COUNT queries, so pull the
+    # flag column only and tally locally.
+    marketing_flags = list(
+        RolePermission.objects.filter(role=RolePermission.ROLE_MARKETING)
+        .values_list('is_allowed', flat=True)
+    )
+    marketing_active = sum(1 for flag in marketing_flags if flag)
+    return {
+        'total_permissions': Permission.objects.count(),
+        'marketing_active': marketing_active,
+        'marketing_inactive': len(marketing_flags) - marketing_active,
+    }
+
+
+def get_permission_stats():
+    return cache.get_or_set(
+        PERMISSION_STATS_CACHE_KEY,
+        _compute_permission_stats,
+        PERMISSION_STATS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_permission_stats():
+    cache.delete(PERMISSION_STATS_CACHE_KEY)
+
+
 def get_role_permissions(role):
     ensure_default_permissions()
     return {
@@ -5,7 +5,7 @@ from django.shortcuts import redirect, render
 
 from auditlog.utils import log_action
 from permissions.models import Permission, RolePermission
-from permissions.utils import ensure_default_permissions
+from permissions.utils import ensure_default_permissions, get_permission_stats
 from superadmin.views import superadmin_required
 
 
@@ -24,10 +24,6 @@ def permission_management_view(request):
     role_map = {role: label for role, label in role_choices}
     role_order = [role for role, _ in role_choices]
 
-    marketing_permissions = [rp for rp in RolePermission.objects.filter(role=RolePermission.ROLE_MARKETING)]
-    marketing_active = sum(1 for rp in marketing_permissions if rp.is_allowed)
-    marketing_inactive = sum(1 for rp in marketing_permissions if not rp.is_allowed)
-
     if request.method == 'POST':
         updated = 0
         for perm in permissions_qs:
@@ -88,7 +84,7 @@ def permission_management_view(request):
             }
         )
 
-    total_permissions = len(permissions_qs)
+    stats = get_permission_stats()
     filter_query = ''
     if filter_type:
         filter_query = f'filter={filter_type}'
@@ -97,9 +93,9 @@ def permission_management_view(request):
         'permissions': permissions,
         'role_choices': role_choices,
         'filter_type': filter_type,
-        'total_permissions': total_permissions,
-        'marketing_active': marketing_active,
-        'marketing_inactive': marketing_inactive,
+        'total_permissions': stats['total_permissions'],
+        'marketing_active': stats['marketing_active'],
+        'marketing_inactive': stats['marketing_inactive'],
         'filter_query': filter_query,
         'page_obj': page_obj,
         'per_page': per_page,
@@ -4,6 +4,7 @@ def user_avatar(request):
     """
     Provide a common `profile_image_url` for all templates.
     Priority: customer profile image -> general profile picture -> fallback ''.
+    `profile_thumb_url` is the 128px rendition for small avatars.
     """
     if not getattr(request, "user", None) or not request.user.is_authenticated:
         return {}
@@ -17,12 +18,16 @@ def user_avatar(request):
     except Exception:
         url = ''
 
+    thumb_url = ''
     if not url:
         try:
             prof = getattr(user, 'profile', None)
             if prof and getattr(prof, 'profile_picture', None):
                 url = prof.profile_picture.url
+                if prof.profile_picture_thumb:
+                    thumb_url = prof.profile_picture_thumb.url
         except Exception:
             url = ''
 
-    return {'profile_image_url': url}
+    # Small avatars (navbar) use the pre-built thumbnail when one exists.
+    return {'profile_image_url': url, 'profile_thumb_url': thumb_url or url}
@@ -0,0 +1 @@
+# Package initializer for profiles management commands
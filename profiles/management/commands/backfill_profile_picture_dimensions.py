@@ -0,0 +1,40 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from profiles.models import Profile
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Store width/height for profile pictures saved before those columns existed."
+
+    def handle(self, *args, **options):
+        updated = 0
+        failed = 0
+
+        profiles = (
+            Profile.objects.exclude(profile_picture='')
+            .exclude(profile_picture__isnull=True)
+            .filter(profile_picture_width__isnull=True)
+            .only('id', 'profile_picture')
+        )
+        for profile in profiles.iterator():
+            picture = profile.profile_picture
+            try:
+                width, height = picture.width, picture.height
+            except Exception:
+                failed += 1
+                logger.warning('Could not read profile picture %s for profile %s', picture.name, profile.pk)
+                continue
+            Profile.objects.filter(pk=profile.pk).update(
+                profile_picture_width=width,
+                profile_picture_height=height,
+            )
+            updated += 1
+
+        msg = f"Backfilled picture dimensions: {updated}; unreadable pictures: {failed}"
+        self.stdout.write(self.style.SUCCESS(msg))
+        logger.info(msg)
@@ -1,12 +1,54 @@
-from django.db import models
+from django.db import models, transaction
 from accounts.models import User
 from django.utils import timezone
 from django.conf import settings
 
 
+# ProfileUpdateRequest.request_type -> User attribute written on approval.
+_REQUEST_TYPE_TO_USER_FIELD = {
+    'first_name': 'first_name',
+    'last_name': 'last_name',
+    'email': 'email',
+    'whatsapp_number': 'whatsapp_no',
+    'last_qualification': 'last_qualification',
+}
+
+
+class StoredDimensionsImageField(models.ImageField):
+    """
+    ImageField that never opens the file just because an instance was loaded.
+
+    The stock field re-reads the image header on post_init whenever the
+    width/height columns are empty, which for rows predating those columns
+    meant a storage read (or a crash on a missing file) on every
+    ``user.profile``. Dimensions are still written whenever a picture is
+    assigned; legacy rows are filled by ``manage.py backfill_profile_picture_dimensions``.
+    """
+
+    def update_dimension_fields(self, instance, force=False, *args, **kwargs):
+        if not force:
+            return
+        super().update_dimension_fields(instance, force, *args, **kwargs)
+
+
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
-    profile_picture = models.ImageField(upload_to='profile_pictures/approved/', null=True, blank=True)
+    profile_picture = StoredDimensionsImageField(
+        upload_to='profile_pictures/approved/',
+        null=True,
+        blank=True,
+        width_field='profile_picture_width',
+        height_field='profile_picture_height',
+    )
+    profile_picture_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    profile_picture_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    # Small WebP rendition of profile_picture, rebuilt by the post_save signal.
+    profile_picture_thumb = models.ImageField(
+        upload_to='profile_pictures/thumbs/',
+        null=True,
+        blank=True,
+        editable=False,
+    )
     bio = models.TextField(max_length=500, blank=True)
     date_of_birth = models.DateField(null=True, blank=True)
     address = models.TextField(max_length=500, blank=True)
@@ -86,9 +128,36 @@ class ProfileUpdateRequest(models.Model):
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.get_request_type_display()} - {self.status}"
     
+    def _claim(self, status, admin_user, notes):
+        """
+        Move this request out of PENDING with one conditional UPDATE.
+
+        Returns False when another admin processed it first. Djongo ignores
+        row locks and transactions, so the filtered update is what keeps two
+        concurrent approvals from both applying the change.
+        """
+        processed_at = timezone.now()
+        claimed = type(self).objects.filter(pk=self.pk, status='PENDING').update(
+            status=status,
+            processed_by=admin_user,
+            processed_at=processed_at,
+            notes=notes,
+        )
+        if not claimed:
+            return False
+        self.status = status
+        self.processed_by = admin_user
+        self.processed_at = processed_at
+        self.notes = notes
+        # update() sends no post_save, so recount the pending badge here.
+        from superadmin.services import refresh_site_counters
+        refresh_site_counters('pending_profile_updates')
+        return True
+    
+    @transaction.atomic
     def approve(self, admin_user, notes=''):
         """Approve the request and update user profile"""
-        if self.status != 'PENDING':
+        if self.status != 'PENDING' or not self._claim('APPROVED', admin_user, notes):
             return False
         
         user = self.user
@@ -98,41 +167,18 @@ class ProfileUpdateRequest(models.Model):
                 # Get or create profile
                 profile, _ = Profile.objects.get_or_create(user=user)
                 profile.profile_picture = self.new_profile_picture
-                profile.save()
-        elif self.request_type == 'first_name':
-            user.first_name = self.updated_value
-            user.save()
-        elif self.request_type == 'last_name':
-            user.last_name = self.updated_value
-            user.save()
-        elif self.request_type == 'email':
-            user.email = self.updated_value
-            user.save()
-        elif self.request_type == 'whatsapp_number':
-            user.whatsapp_no = self.updated_value
-            user.save()
-        elif self.request_type == 'last_qualification':
-            user.last_qualification = self.updated_value
-            user.save()
-        
-        # Update request status
-        self.status = 'APPROVED'
-        self.processed_by = admin_user
-        self.processed_at = timezone.now()
-        self.notes = notes
-        self.save()
+                profile.save(update_fields=[
+                    'profile_picture', 'profile_picture_width', 'profile_picture_height', 'updated_at',
+                ])
+        else:
+            field = _REQUEST_TYPE_TO_USER_FIELD.get(self.request_type)
+            if field:
+                setattr(user, field, self.updated_value)
+                user.save(update_fields=[field])
         
         return True
     
+    @transaction.atomic
     def reject(self, admin_user, notes=''):
         """Reject the request"""
-        if self.status != 'PENDING':
-            return False
-        
-        self.status = 'REJECTED'
-        self.processed_by = admin_user
-        self.processed_at = timezone.now()
-        self.notes = notes
-        self.save()
-        
-        return True
\ No newline at end of file
+        return self.status == 'PENDING' and self._claim('REJECTED', admin_user, notes)
\ No newline at end of file
@@ -1,18 +1,43 @@
-from django.db.models.signals import post_save
+import logging
+
+from django.db.models.signals import post_init, post_save
 from django.dispatch import receiver
 from accounts.models import User
 from .models import Profile
+from .utils import build_profile_thumbnail
+
+logger = logging.getLogger(__name__)
 
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     """Create profile when user is created"""
     if created:
+        # Created inline so code later in the same atomic block can read user.profile.
         Profile.objects.get_or_create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save profile when user is saved"""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+@receiver(post_init, sender=Profile)
+def remember_thumbnail_source(sender, instance, **kwargs):
+    """Record which picture the stored thumbnail was built from"""
+    # Skip deferred loads (.only()/.defer()); reading the field would query again.
+    if 'profile_picture' in instance.__dict__:
+        instance._thumb_source = instance.profile_picture.name or ''
+
+
+@receiver(post_save, sender=Profile)
+def refresh_profile_thumbnail(sender, instance, update_fields=None, **kwargs):
+    """Rebuild the avatar thumbnail when the profile picture changed or the thumbnail is missing"""
+    if update_fields is not None and 'profile_picture' not in update_fields:
+        return
+    picture_name = instance.profile_picture.name or ''
+    has_thumb = bool(instance.profile_picture_thumb)
+    source = getattr(instance, '_thumb_source', None)
+    if has_thumb == bool(picture_name) and source in (None, picture_name):
+        return
+    try:
+        build_profile_thumbnail(instance)
+    except Exception:
+        logger.exception('Could not build profile thumbnail for profile %s', instance.pk)
+    else:
+        instance._thumb_source = picture_name
@@ -0,0 +1,99 @@
+import logging
+import os
+import threading
+from io import BytesIO
+
+from PIL import Image
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.mail import EmailMessage, get_connection
+from django.db import connections, transaction
+
+from accounts.models import User
+from .models import Profile, ProfileUpdateRequest
+
+logger = logging.getLogger(__name__)
+
+PROFILE_THUMB_SIZE = (128, 128)
+
+
+def notify_superadmins_of_update_request(update_request_id):
+    """Email every active superadmin about a new profile update request"""
+    try:
+        update_request = ProfileUpdateRequest.objects.select_related('user').get(pk=update_request_id)
+        # Djongo-safe superadmin query (no is_active=True in DB filter);
+        # only the email/is_active columns are fetched.
+        admin_emails = [
+            email
+            for email, is_active in User.objects.filter(role='SUPERADMIN').values_list('email', 'is_active')
+            if is_active and email
+        ]
+        
+        # Notify super admins over a single SMTP connection
+        subject = 'New Profile Update Request'
+        body = (
+            f'{update_request.user.get_full_name()} has requested to update '
+            f'their {update_request.request_type}.\n\nPlease review and approve/reject.'
+        )
+        if not admin_emails:
+            return
+        with get_connection(fail_silently=True) as connection:
+            connection.send_messages([
+                EmailMessage(subject, body, settings.EMAIL_HOST_USER, [email], connection=connection)
+                for email in admin_emails
+            ])
+    except Exception:
+        logger.exception('Error sending profile update email')
+    finally:
+        # The worker thread owns its own DB connections.
+        connections.close_all()
+
+
+def queue_superadmin_update_notice(update_request):
+    """Send the superadmin notice in a background thread once the request is committed"""
+    def _start():
+        threading.Thread(
+            target=notify_superadmins_of_update_request,
+            args=(update_request.pk,),
+            daemon=True,
+        ).start()
+
+    transaction.on_commit(_start)
+
+
+def _delete_stored_file(storage, name):
+    if not name:
+        return
+    try:
+        storage.delete(name)
+    except Exception:
+        logger.warning('Could not delete old profile thumbnail %s', name)
+
+
+def build_profile_thumbnail(profile):
+    """Store a WebP thumbnail of the profile picture so avatars skip decoding the original"""
+    picture = profile.profile_picture
+    thumb = profile.profile_picture_thumb
+    old_thumb_name = thumb.name
+    if not picture:
+        if old_thumb_name:
+            Profile.objects.filter(pk=profile.pk).update(profile_picture_thumb='')
+            _delete_stored_file(thumb.storage, old_thumb_name)
+            thumb.name = None
+        return
+    
+    with picture.open('rb') as source:
+        image = Image.open(source)
+        image.thumbnail(PROFILE_THUMB_SIZE)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        buffer = BytesIO()
+        image.save(buffer, format='WEBP', quality=80)
+    
+    base_name = os.path.splitext(os.path.basename(picture.name))[0]
+    thumb.save(f'{base_name}.webp', ContentFile(buffer.getvalue()), save=False)
+    # Queryset update keeps post_save from firing again for the thumbnail.
+    Profile.objects.filter(pk=profile.pk).update(profile_picture_thumb=thumb.name)
+    if old_thumb_name and old_thumb_name != thumb.name:
+        _delete_stored_file(thumb.storage, old_thumb_name)
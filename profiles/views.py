@@ -1,13 +1,21 @@
+import logging
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.auth import update_session_auth_hash
-from django.core.mail import send_mail
-from django.conf import settings
 from accounts.models import User
 from .models import Profile, ProfileUpdateRequest
 from .forms import ProfileUpdateRequestForm, CustomPasswordChangeForm, SuperAdminProfileUpdateForm
 from auditlog.utils import log_action
+from .utils import queue_superadmin_update_notice
+
+logger = logging.getLogger(__name__)
+
+
+def _get_profile(user):
+    """Return the user's profile via the cached reverse accessor, creating it if missing"""
+    return getattr(user, 'profile', None) or Profile.objects.create(user=user)
 
 @login_required
 def profile_view(request):
@@ -15,7 +23,7 @@ def profile_view(request):
     user = request.user
     
     # Create profile if doesn't exist
-    profile, created = Profile.objects.get_or_create(user=user)
+    profile = _get_profile(user)
     
     context = {
         'user': user,
@@ -28,10 +36,10 @@ def profile_view(request):
 def request_profile_update(request):
     """Submit profile update request"""
     # ✅ ensure we have a Profile object (where profile_picture actually lives)
-    profile, _ = Profile.objects.get_or_create(user=request.user)
+    profile = _get_profile(request.user)
     
     # role check (keep your marketing restriction, but robust)
-    if str(getattr(request.user, 'role', '')).upper() != 'MARKETING':
+    if request.user.role != User.ROLE_MARKETING:
         messages.error(request, 'This feature is only available for marketing team.')
         return redirect('profiles:profile')
     
@@ -40,9 +48,7 @@ def request_profile_update(request):
         if form.is_valid():
             request_type = form.cleaned_data['request_type']
             
-            print(f"=== PROFILE UPDATE REQUEST DEBUG ===")
-            print(f"Request Type: {request_type}")
-            print(f"Files in request: {request.FILES}")
+            logger.debug('Profile update request: type=%s files=%s', request_type, request.FILES)
             
             # Get current value
             if request_type == 'profile_picture':
@@ -55,9 +61,11 @@ def request_profile_update(request):
                 updated_value = 'New picture uploaded'
                 new_picture = form.cleaned_data.get('new_profile_picture')
                 
-                print(f"New picture from form: {new_picture}")
-                print(f"New picture name: {new_picture.name if new_picture else 'None'}")
-                print(f"New picture size: {new_picture.size if new_picture else 'None'}")
+                logger.debug(
+                    'New picture from form: %s (size: %s)',
+                    new_picture,
+                    getattr(new_picture, 'size', None),
+                )
                 
                 if not new_picture:
                     messages.error(request, 'Please select a profile picture to upload.')
@@ -84,10 +92,15 @@ def request_profile_update(request):
                 new_profile_picture=new_picture,
             )
             
-            print(f"Created update request ID: {update_request.id}")
-            if request_type == 'profile_picture':
-                print(f"Saved picture path: {update_request.new_profile_picture}")
-                print(f"Picture URL: {update_request.new_profile_picture.url if update_request.new_profile_picture else 'None'}")
+            logger.debug('Created update request ID: %s', update_request.id)
+            # Resolving .url goes through the storage backend (and may sign the
+            # URL), so only do it when debug output is actually emitted.
+            if request_type == 'profile_picture' and logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Saved picture path: %s', update_request.new_profile_picture)
+                logger.debug(
+                    'Picture URL: %s',
+                    update_request.new_profile_picture.url if update_request.new_profile_picture else None,
+                )
             
             # Log the action (matches log_action signature)
             log_action(
@@ -98,25 +111,8 @@ def request_profile_update(request):
                 request=request,
             )
             
-            # Djongo-safe superadmin query (no is_active=True in DB filter)
-            admins_qs = User.objects.filter(role='SUPERADMIN')
-            superadmins = [admin for admin in admins_qs if admin.is_active]
-            
-            # Notify super admin
-            for admin in superadmins:
-                try:
-                    send_mail(
-                        subject='New Profile Update Request',
-                        message=(
-                            f'{request.user.get_full_name()} has requested to update '
-                            f'their {request_type}.\n\nPlease review and approve/reject.'
-                        ),
-                        from_email=settings.EMAIL_HOST_USER,
-                        recipient_list=[admin.email],
-                        fail_silently=True,
-                    )
-                except Exception as e:
-                    print(f"Error sending email: {e}")
+            # Notify super admins without blocking the response on SMTP
+            queue_superadmin_update_notice(update_request)
             
             messages.success(
                 request,
@@ -126,7 +122,7 @@ def request_profile_update(request):
             return redirect('profiles:profile')
         else:
             messages.error(request, 'Please correct the errors below.')
-            print(f"Form errors: {form.errors}")
+            logger.debug('Form errors: %s', form.errors)
     else:
         form = ProfileUpdateRequestForm(user=request.user)
     
@@ -134,7 +130,7 @@ def request_profile_update(request):
     pending_requests = ProfileUpdateRequest.objects.filter(
         user=request.user,
         status='PENDING'
-    ).order_by('-created_at')
+    ).only('id', 'request_type', 'status', 'created_at').order_by('-created_at')
     
     context = {
         'form': form,
@@ -178,7 +174,7 @@ def change_password_view(request):
 @login_required
 def superadmin_profile_update(request):
     """SuperAdmin profile update (can update directly with notes for email/WhatsApp)"""
-    if request.user.role != 'superadmin':
+    if request.user.role != User.ROLE_SUPERADMIN:
         messages.error(request, 'Access denied.')
         return redirect('profiles:profile')
     
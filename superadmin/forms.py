@@ -1,15 +1,82 @@
-from datetime import datetime
+import re
+import secrets
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from django import forms
+from django.contrib.auth.hashers import make_password
+from django.core.validators import DomainNameValidator
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from accounts.forms import COUNTRY_CODES
 from accounts.models import User
 from accounts.validators import validate_whatsapp_number
+from profiles.models import Profile
+from superadmin.services import refresh_site_counters
 from superadmin.models import Announcement, PricingPlan, SystemSettings, GoogleAuthConfig
 
 
+# Built once at import; User.whatsapp_country_code has no model-level choices,
+# so the Select widget is the only place these are needed.
+COUNTRY_CODE_CHOICES = tuple(COUNTRY_CODES)
+
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits
+
+# File extensions are pulled from the comma separated setting, anything else
+# being a separator. Domains are split on commas/whitespace and validated whole.
+_EXTENSION_RE = re.compile(r'[a-z0-9]+(?:\.[a-z0-9]+)*')
+_LIST_SEPARATOR_RE = re.compile(r'[\s,]+')
+
+
+def _generate_password(length=10):
+    return ''.join(secrets.choice(_PASSWORD_ALPHABET) for _ in range(length))
+
+
+# Password hashing is CPU bound but the hashers release the GIL inside their
+# C primitives, so a small pool overlaps them during bulk onboarding.
+PASSWORD_HASH_WORKERS = 4
+USER_BULK_BATCH_SIZE = 500
+
+
+def _assign_employee_ids(users):
+    """
+    Give each user without an employee_id the next free serial for its base.
+
+    Serials already stored, or supplied by other users in the batch, are read
+    with one query and never reused.
+    """
+    bases = {user.employee_id_base() for user in users if not user.employee_id}
+    if not bases:
+        return
+    query = Q()
+    for base in bases:
+        query |= Q(employee_id__startswith=base)
+    taken = list(User.objects.filter(query).values_list('employee_id', flat=True))
+    taken += [user.employee_id for user in users if user.employee_id]
+
+    next_serial = dict.fromkeys(bases, 1)
+    for employee_id in taken:
+        for base in bases:
+            suffix = employee_id[len(base):] if employee_id.startswith(base) else ''
+            if suffix.isdigit():
+                next_serial[base] = max(next_serial[base], int(suffix) + 1)
+
+    for user in users:
+        if not user.employee_id:
+            base = user.employee_id_base()
+            user.employee_id = f'{base}{next_serial[base]}'
+            next_serial[base] += 1
+
+
+def _changed_model_fields(form):
+    """Model fields the bound form actually changed (ignores form-only fields)"""
+    return [name for name in form.changed_data if name in form._meta.fields]
+
+
 class UserCreateForm(forms.ModelForm):
     auto_generate_password = forms.BooleanField(
         required=False,
@@ -45,7 +112,7 @@ class UserCreateForm(forms.ModelForm):
             'first_name': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'First name'}),
             'last_name': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Last name'}),
             'email': forms.EmailInput(attrs={'class': 'form-control', 'placeholder': 'Email address'}),
-            'whatsapp_country_code': forms.Select(attrs={'class': 'form-select'}, choices=COUNTRY_CODES),
+            'whatsapp_country_code': forms.Select(attrs={'class': 'form-select'}, choices=COUNTRY_CODE_CHOICES),
             'whatsapp_no': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'WhatsApp number'}),
             'last_qualification': forms.TextInput(attrs={'class': 'form-control', 'placeholder': 'Last qualification'}),
             'role': forms.Select(attrs={'class': 'form-select'}),
@@ -57,7 +124,6 @@ class UserCreateForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['whatsapp_country_code'].choices = COUNTRY_CODES
         if not self.instance or not self.instance.pk:
             self.fields['is_active'].initial = True
 
@@ -79,7 +145,7 @@ class UserCreateForm(forms.ModelForm):
         auto = self.cleaned_data.get('auto_generate_password')
         password = self.cleaned_data.get('password')
         if auto or not password:
-            password = User.objects.make_random_password()
+            password = _generate_password()
             self.generated_password = password
         else:
             self.generated_password = None
@@ -88,9 +154,59 @@ class UserCreateForm(forms.ModelForm):
         user.is_approved = True
         user.is_staff = user.role == 'SUPERADMIN'
         if commit:
-            user.save()
+            with transaction.atomic():
+                user.save()
         return user
 
+    @classmethod
+    def bulk_create_with_passwords(cls, rows):
+        """
+        Create approved users from dicts of User field values in one transaction.
+
+        A row's optional 'password' is used as-is, otherwise one is generated.
+        Each user also gets a Profile, as the post_save receiver would create.
+        Returns a list of (user, plaintext_password) pairs.
+        """
+        users, passwords = [], []
+        for row in rows:
+            row = dict(row)
+            passwords.append(row.pop('password', None) or _generate_password())
+            user = User(**row)
+            user.role = (user.role or '').upper()
+            user.is_approved = True
+            user.is_staff = user.role == User.ROLE_SUPERADMIN
+            users.append(user)
+        if not users:
+            return []
+
+        with ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS) as pool:
+            hashes = list(pool.map(make_password, passwords))
+
+        with transaction.atomic():
+            # bulk_create bypasses User.save(), so assign the generated codes here.
+            _assign_employee_ids(users)
+            for user, password_hash in zip(users, hashes):
+                user.password = password_hash
+                if user.role == User.ROLE_CUSTOMER:
+                    user.generate_customer_code()
+            User.objects.bulk_create(users, batch_size=USER_BULK_BATCH_SIZE)
+
+            # Djongo does not return auto primary keys from bulk inserts.
+            if any(user.pk is None for user in users):
+                pks = dict(User.objects.filter(
+                    email__in=[user.email for user in users],
+                ).values_list('email', 'pk'))
+                for user in users:
+                    user.pk = pks[user.email]
+
+            # bulk_create sends no post_save, so do what its receivers would.
+            Profile.objects.bulk_create(
+                [Profile(user=user) for user in users],
+                batch_size=USER_BULK_BATCH_SIZE,
+            )
+            refresh_site_counters('pending_user_approvals')
+        return list(zip(users, passwords))
+
 
 class UserUpdateForm(forms.ModelForm):
     reset_password = forms.BooleanField(
@@ -125,7 +241,7 @@ class UserUpdateForm(forms.ModelForm):
             'first_name': forms.TextInput(attrs={'class': 'form-control'}),
             'last_name': forms.TextInput(attrs={'class': 'form-control'}),
             'email': forms.EmailInput(attrs={'class': 'form-control'}),
-            'whatsapp_country_code': forms.Select(attrs={'class': 'form-select'}, choices=COUNTRY_CODES),
+            'whatsapp_country_code': forms.Select(attrs={'class': 'form-select'}, choices=COUNTRY_CODE_CHOICES),
             'whatsapp_no': forms.TextInput(attrs={'class': 'form-control'}),
             'last_qualification': forms.TextInput(attrs={'class': 'form-control'}),
             'role': forms.Select(attrs={'class': 'form-select'}),
@@ -133,29 +249,43 @@ class UserUpdateForm(forms.ModelForm):
         }
         labels = {'is_active': 'Active Status'}
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['whatsapp_country_code'].choices = COUNTRY_CODES
-
     def clean_whatsapp_no(self):
         number = self.cleaned_data.get('whatsapp_no', '')
         validate_whatsapp_number(number)
         return number
 
     def save(self, commit=True):
+        self.generated_password = None
+        self.plaintext_password = None
+        # Re-submitting an untouched form for an already consistent user is a
+        # no-op; skip the UPDATE entirely.
+        instance = self.instance
+        if (
+            not self.changed_data
+            and not self.cleaned_data.get('reset_password')
+            and instance.is_approved
+            and instance.is_staff == (instance.role == User.ROLE_SUPERADMIN)
+        ):
+            return instance
         user = super().save(commit=False)
-        user.is_staff = user.role == 'SUPERADMIN'
+        user.is_staff = user.role == User.ROLE_SUPERADMIN
         user.is_approved = True
-        self.generated_password = None
         new_password = None
-        self.plaintext_password = None
         if self.cleaned_data.get('reset_password'):
-            new_password = self.cleaned_data.get('new_password') or User.objects.make_random_password()
+            new_password = self.cleaned_data.get('new_password') or _generate_password()
             self.generated_password = new_password
             self.plaintext_password = new_password
             user.set_password(new_password)
         if commit:
-            user.save()
+            if user._state.adding:
+                user.save()
+            else:
+                update_fields = _changed_model_fields(self) + ['is_staff', 'is_approved', 'role']
+                if new_password:
+                    update_fields.append('password')
+                # User.save() may assign these on first approval / role change.
+                update_fields += ['employee_id', 'customer_code']
+                user.save(update_fields=update_fields)
         return user
 
 
@@ -179,13 +309,10 @@ class SystemSettingsForm(forms.ModelForm):
 
     def clean_allowed_file_types(self):
         value = self.cleaned_data.get('allowed_file_types', '')
-        cleaned = ",".join(
-            sorted({part.strip().lower().strip('.')
-                    for part in value.split(',') if part.strip()})
-        )
-        if not cleaned:
+        parts = _EXTENSION_RE.findall((value or '').lower())
+        if not parts:
             raise forms.ValidationError('Provide at least one file extension.')
-        return cleaned
+        return ",".join(sorted(set(parts)))
 
 
 class PricingPlanForm(forms.ModelForm):
@@ -303,13 +430,19 @@ class AnnouncementForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Blank create forms have no datetime defaults to format.
+        if not self.instance.pk and not (self.initial.get('start_at') or self.initial.get('end_at')):
+            return
         # Format datetime defaults for HTML datetime-local inputs
         tz = timezone.get_current_timezone()
         for field_name in ('start_at', 'end_at'):
             value = self.initial.get(field_name) or getattr(self.instance, field_name, None)
-            if isinstance(value, datetime):
-                localized = timezone.localtime(value, tz)
-                self.initial[field_name] = localized.strftime(self.datetime_format)
+            # Datetimes (unlike dates or raw strings) expose astimezone().
+            if hasattr(value, 'astimezone'):
+                # Naive isoformat at minute precision matches datetime_format
+                # without the offset suffix an aware value would add.
+                local = timezone.localtime(value, tz).replace(tzinfo=None)
+                self.initial[field_name] = local.isoformat(timespec='minutes')
 
     def clean(self):
         cleaned = super().clean()
@@ -326,7 +459,13 @@ class AnnouncementForm(forms.ModelForm):
             announcement.attachment.delete(save=False)
             announcement.attachment = None
         if commit:
-            announcement.save()
+            if announcement._state.adding:
+                announcement.save()
+            else:
+                update_fields = _changed_model_fields(self)
+                if remove_attachment and 'attachment' not in update_fields:
+                    update_fields.append('attachment')
+                announcement.save(update_fields=update_fields + ['updated_at'])
             self.save_m2m()
         return announcement
 
@@ -363,9 +502,35 @@ class GoogleAuthConfigForm(forms.ModelForm):
         }
 
     def clean_allowed_domains(self):
-        data = self.cleaned_data.get('allowed_domains', '')
-        parts = [p.strip().lower() for p in data.split(',') if p.strip()]
-        return ','.join(parts)
+        data = (self.cleaned_data.get('allowed_domains') or '').strip()
+        if not data:
+            return ''
+        domains = set(filter(None, _LIST_SEPARATOR_RE.split(data.lower())))
+        validate_domain = DomainNameValidator()
+        rejected = []
+        for domain in domains:
+            try:
+                validate_domain(domain)
+            except forms.ValidationError:
+                rejected.append(domain)
+        if rejected:
+            raise forms.ValidationError(
+                _('Not a valid domain: %(domains)s'),
+                params={'domains': ', '.join(sorted(rejected))},
+            )
+        return ','.join(sorted(domains))
+
+
+@lru_cache(maxsize=8)
+def _build_backup_choices(table_key):
+    """Status/table choices for BackupExportForm, keyed on (app_label, key, choice_label) tuples"""
+    app_labels = sorted({app_label for app_label, _, _ in table_key})
+    # Tuples: the cached result is shared by every form instance.
+    status_choices = (('', 'All modules'),) + tuple(
+        (label, label.replace('_', ' ').title()) for label in app_labels
+    )
+    table_choices = tuple((key, choice_label) for _, key, choice_label in table_key)
+    return status_choices, table_choices
 
 
 class BackupExportForm(forms.Form):
@@ -391,7 +556,14 @@ class BackupExportForm(forms.Form):
         choices=[],
         widget=forms.Select(attrs={'class': 'form-select'}),
     )
-    tables = forms.MultipleChoiceField(
+    # The checkboxes are only the picker UI: the page script packs the checked
+    # keys into the hidden ``tables`` input and drops the per-table keys from
+    # the POST. Without JS the checkboxes are submitted and used as fallback.
+    tables = forms.CharField(
+        required=False,
+        widget=forms.HiddenInput,
+    )
+    table_picker = forms.MultipleChoiceField(
         required=False,
         label='Sub Status (Tables)',
         widget=forms.CheckboxSelectMultiple,
@@ -410,21 +582,30 @@ class BackupExportForm(forms.Form):
     def __init__(self, *args, table_metadata=None, **kwargs):
         self.table_metadata = table_metadata or []
         super().__init__(*args, **kwargs)
-        app_labels = sorted({item['app_label'] for item in self.table_metadata})
-        self.fields['status'].choices = [('', 'All modules')] + [
-            (label, label.replace('_', ' ').title()) for label in app_labels
-        ]
+        table_key = tuple(
+            (item['app_label'], item['key'], item['choice_label']) for item in self.table_metadata
+        )
+        status_choices, table_choices = _build_backup_choices(table_key)
+        self.fields['status'].choices = status_choices
         selected_status = self.data.get(self.add_prefix('status')) or self.initial.get('status')
         self.selected_status = selected_status
-        table_choices = [
-            (item['key'], item['choice_label']) for item in self.table_metadata
-        ]
-        self.fields['tables'].choices = table_choices
+        self.fields['table_picker'].choices = table_choices
+        self.table_keys = frozenset(key for key, _ in table_choices)
+
+    def clean_tables(self):
+        packed = self.cleaned_data.get('tables') or ''
+        if not packed:
+            return []
+        keys = [key for key in packed.split(',') if key]
+        if not self.table_keys.issuperset(keys):
+            raise forms.ValidationError(_('Select a valid table.'))
+        return list(dict.fromkeys(keys))
 
     def clean(self):
         cleaned = super().clean()
         include_all = cleaned.get('include_all')
-        tables = cleaned.get('tables') or []
+        tables = cleaned.get('tables') or cleaned.get('table_picker') or []
+        cleaned['tables'] = tables
         status = cleaned.get('status') or self.selected_status
         if not include_all and not tables and not status:
             self.add_error(
@@ -0,0 +1 @@
+# Package initializer for superadmin management commands
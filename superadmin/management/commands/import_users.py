@@ -0,0 +1,47 @@
+import csv
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from superadmin.forms import UserCreateForm
+
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FIELDS = (
+    'email', 'first_name', 'last_name', 'role',
+    'whatsapp_country_code', 'whatsapp_no', 'employee_id', 'password',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create approved users from a CSV file with an email, first_name, last_name "
+        "and role header, plus optional whatsapp_country_code, whatsapp_no, "
+        "employee_id and password columns. Writes the created logins to --output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path', help='CSV file of users to create.')
+        parser.add_argument('--output', required=True, help='CSV file to write email, employee_id and password to.')
+
+    def handle(self, *args, **options):
+        with open(options['csv_path'], newline='', encoding='utf-8-sig') as handle:
+            rows = [
+                {field: value.strip() for field, value in row.items() if field in IMPORT_FIELDS and value and value.strip()}
+                for row in csv.DictReader(handle)
+            ]
+        missing = [n for n, row in enumerate(rows, start=2) if not row.get('email')]
+        if missing:
+            raise CommandError(f"Rows without an email on lines: {', '.join(map(str, missing))}")
+
+        created = UserCreateForm.bulk_create_with_passwords(rows)
+
+        with open(options['output'], 'w', newline='', encoding='utf-8') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(['email', 'employee_id', 'password'])
+            for user, password in created:
+                writer.writerow([user.email, user.employee_id or '', password])
+
+        logger.info("Imported %s users from %s", len(created), options['csv_path'])
+        self.stdout.write(self.style.SUCCESS(f"Created {len(created)} users; logins written to {options['output']}"))
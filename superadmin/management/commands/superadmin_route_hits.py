@@ -0,0 +1,38 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.urls import Resolver404, resolve
+from django.utils import timezone
+
+from auditlog.models import PageVisit
+
+
+class Command(BaseCommand):
+    help = (
+        'Count recorded page visits per superadmin URL name, most visited first. '
+        'Use it to keep superadmin/urls.py ordered by traffic.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=7, help='How many days of page visits to read.')
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options['days'])
+        paths = PageVisit.objects.filter(
+            started_at__gte=since,
+            page_path__startswith='/superadmin/',
+        ).values_list('page_path', flat=True)
+
+        hits = Counter()
+        for page_path in paths.iterator():
+            try:
+                match = resolve(page_path.split('?', 1)[0])
+            except Resolver404:
+                continue
+            if match.namespace == 'superadmin':
+                hits[match.url_name] += 1
+
+        for url_name, count in hits.most_common():
+            self.stdout.write(f'{count:>8}  {url_name}')
+        self.stdout.write(self.style.SUCCESS(f'{sum(hits.values())} visits over {options["days"]} days'))
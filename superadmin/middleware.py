@@ -1,11 +1,21 @@
+import atexit
 import json
+import logging
+import queue
+import threading
+import time
+from types import MappingProxyType
 
+from django.db import close_old_connections, transaction
 from django.utils.deprecation import MiddlewareMixin
 
-from .models import ErrorLog
+logger = logging.getLogger(__name__)
 
+# Shared compact encoder for ErrorLog.meta (a TextField).
+_encode_meta = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
 
-ERROR_MESSAGES = {
+
+ERROR_MESSAGES = MappingProxyType({
     'EFR-001': "Please write a short description of the issue.",
     'EFR-002': "File type not supported. Upload PNG/JPG/PDF only.",
     'EFR-003': "File too large. Max allowed size is X MB.",
@@ -23,7 +33,113 @@ ERROR_MESSAGES = {
     'EFR-902': "Attachment upload failed. Submit without file or try again.",
     'EFR-903': "Issue created, but notify failed.",
     'EFR-904': "Too many reports. Please wait and try again.",
-}
+})
+
+
+# Error logs are written off the request thread: process_view queues unsaved
+# ErrorLog rows and a daemon thread inserts them in batches. At interpreter
+# exit the writer is told to flush what is queued before the process ends.
+ERROR_LOG_QUEUE_SIZE = 10000
+ERROR_LOG_BATCH_SIZE = 500
+ERROR_LOG_FLUSH_SECONDS = 1.0
+ERROR_LOG_SHUTDOWN_SECONDS = 10.0
+
+_error_log_queue = queue.Queue(maxsize=ERROR_LOG_QUEUE_SIZE)
+_STOP_WRITER = object()
+_writer_lock = threading.Lock()
+_writer_thread = None
+dropped_error_logs = 0
+
+# Imported on first use so loading the middleware does not pull in
+# superadmin.models for processes that never log an error code.
+_ErrorLog = None
+
+
+def _get_log_model():
+    global _ErrorLog
+    if _ErrorLog is None:
+        from .models import ErrorLog
+        _ErrorLog = ErrorLog
+    return _ErrorLog
+
+
+def _report_dropped_error_logs():
+    global dropped_error_logs
+    dropped, dropped_error_logs = dropped_error_logs, 0
+    if dropped:
+        logger.warning('Error log queue was full; dropped %s rows', dropped)
+
+
+def _flush_error_logs(batch):
+    try:
+        with transaction.atomic():
+            _get_log_model().objects.bulk_create(batch, batch_size=ERROR_LOG_BATCH_SIZE)
+    except Exception:
+        # Never let a DB failure kill the writer thread.
+        logger.exception('Could not write %s error log rows', len(batch))
+    finally:
+        close_old_connections()
+    _report_dropped_error_logs()
+
+
+def _error_log_writer():
+    while True:
+        entry = _error_log_queue.get()
+        if entry is _STOP_WRITER:
+            return
+        batch = [entry]
+        stopping = False
+        deadline = time.monotonic() + ERROR_LOG_FLUSH_SECONDS
+        while len(batch) < ERROR_LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = _error_log_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is _STOP_WRITER:
+                stopping = True
+                break
+            batch.append(entry)
+        _flush_error_logs(batch)
+        if stopping:
+            return
+
+
+@atexit.register
+def _stop_writer():
+    """Let the writer flush the queued rows; daemon threads are killed at exit"""
+    _report_dropped_error_logs()
+    if _writer_thread is None or not _writer_thread.is_alive():
+        return
+    try:
+        # Queued behind the pending rows, so everything before it is written.
+        _error_log_queue.put(_STOP_WRITER, timeout=ERROR_LOG_SHUTDOWN_SECONDS)
+    except queue.Full:
+        logger.warning('Error log queue still full at exit; %s rows not written', _error_log_queue.qsize())
+        return
+    _writer_thread.join(ERROR_LOG_SHUTDOWN_SECONDS)
+
+
+def _ensure_writer():
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_error_log_writer, name='error-log-writer', daemon=True)
+            _writer_thread.start()
+
+
+def enqueue_error_log(entry):
+    """Queue an unsaved ErrorLog for the background writer; drops it if the queue is full"""
+    global dropped_error_logs
+    _ensure_writer()
+    try:
+        _error_log_queue.put_nowait(entry)
+    except queue.Full:
+        dropped_error_logs += 1
 
 
 class ErrorCodeLoggingMiddleware(MiddlewareMixin):
@@ -32,22 +148,28 @@ class ErrorCodeLoggingMiddleware(MiddlewareMixin):
     """
 
     def process_view(self, request, view_func, view_args, view_kwargs):
+        # error_code only ever arrives on GET redirects with a query string.
+        if request.method != 'GET' or not request.GET:
+            return None
         code = request.GET.get('error_code')
-        if not code or code not in ERROR_MESSAGES:
+        message = ERROR_MESSAGES.get(code) if code else None
+        if not message:
             return None
+        user = getattr(request, 'user', None)
+        is_authenticated = bool(user and user.is_authenticated)
         try:
-            ErrorLog.objects.create(
+            enqueue_error_log(_get_log_model()(
                 code=code,
-                message=ERROR_MESSAGES.get(code, ''),
+                message=message,
                 path=request.path[:512],
                 method=request.method,
-                user=request.user if getattr(request, 'user', None) and request.user.is_authenticated else None,
-                role=(getattr(request, 'user', None).role if getattr(request, 'user', None) else ''),
-                meta=json.dumps({
+                user=user if is_authenticated else None,
+                role=getattr(user, 'role', '') if is_authenticated else '',
+                meta=_encode_meta({
                     'remote_addr': request.META.get('REMOTE_ADDR'),
                     'user_agent': request.META.get('HTTP_USER_AGENT', '')[:255],
                 }),
-            )
+            ))
         except Exception:
             # Avoid breaking the request cycle due to logging failures.
             return None
@@ -1,12 +1,40 @@
-import random
+import secrets
+import time
+import uuid
+from functools import cached_property
 
 from django.conf import settings
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import F, Q
 from django.utils import timezone
 from django.urls import NoReverseMatch, reverse
 from accounts.models import User
-from django.core.validators import validate_email
-from django.core.exceptions import ValidationError
+
+
+# Singleton rows (pk=1) are read on most config-driven pages but rarely written.
+# get_solo() serves them from the cache; superadmin.signals drops the entry on
+# save/delete. Callers doing read-modify-write on balances pass cached=False.
+# The default cache is per process, so other workers only see a change once
+# their copy expires; keep the timeout short.
+SOLO_CACHE_TIMEOUT = 30
+
+
+def _solo_cache_key(model):
+    return f'solo:{model._meta.label_lower}'
+
+
+def _cached_solo(model):
+    key = _solo_cache_key(model)
+    obj = cache.get(key)
+    if obj is None:
+        obj = model.get_solo(cached=False)
+        cache.set(key, obj, SOLO_CACHE_TIMEOUT)
+    return obj
+
+
+def invalidate_solo(model):
+    cache.delete(_solo_cache_key(model))
 
 
 class ErrorLog(models.Model):
@@ -67,26 +95,63 @@ class SystemSettings(models.Model):
         return 'Global System Settings'
 
     @classmethod
-    def get_solo(cls):
+    def get_solo(cls, cached=True):
+        if cached:
+            return _cached_solo(cls)
         obj, created = cls.objects.get_or_create(pk=1, defaults=cls.DEFAULTS)
-        # Ensure missing fields fall back to defaults
-        changed = False
-        for field, value in cls.DEFAULTS.items():
-            if getattr(obj, field) in (None, ''):
+        if created:
+            return obj
+        # Ensure missing fields fall back to defaults, writing only those columns
+        changes = {
+            field: value for field, value in cls.DEFAULTS.items()
+            if getattr(obj, field) in (None, '')
+        }
+        if changes:
+            cls.objects.filter(pk=obj.pk).update(**changes)
+            for field, value in changes.items():
                 setattr(obj, field, value)
-                changed = True
-        if changed:
-            obj.save()
         return obj
 
 
+class SiteCounters(models.Model):
+    """
+    Single-row table of the pending counts shown to superadmins. The signal
+    receivers in superadmin.signals keep it current so page renders read one
+    row instead of running COUNT queries.
+    """
+    SOLO_PK = 1
+    COUNTER_FIELDS = ('pending_user_approvals', 'pending_profile_updates', 'new_jobs_count')
+
+    id = models.BigAutoField(primary_key=True)
+    pending_user_approvals = models.PositiveIntegerField(default=0)
+    pending_profile_updates = models.PositiveIntegerField(default=0)
+    new_jobs_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'site_counters'
+
+    def __str__(self):
+        return 'Site Counters'
+
+
 def _generate_bigint_id():
     """
     Djongo does not auto-increment numeric IDs reliably, so we generate
-    a timestamp-based unique integer that fits into BigAutoField.
+    a random unique integer that fits into BigAutoField. 56 bits keeps it
+    positive and makes collisions negligible even for bulk inserts.
     """
-    base = int(timezone.now().timestamp() * 1_000_000)  # microseconds
-    return base * 100 + random.randint(10, 99)
+    return int.from_bytes(secrets.token_bytes(7), 'big')
+
+
+class StrRelatedManager(models.Manager):
+    """Default manager joining the relations named in the model's STR_RELATED, so __str__ does not query per row"""
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        related = getattr(self.model, 'STR_RELATED', ())
+        # select_related() with no arguments would follow every FK.
+        return qs.select_related(*related) if related else qs
 
 
 class AdminWallet(models.Model):
@@ -102,10 +167,28 @@ class AdminWallet(models.Model):
         db_table = 'admin_wallet'
 
     @classmethod
-    def get_solo(cls):
+    def get_solo(cls, cached=True):
+        if cached:
+            return _cached_solo(cls)
         obj, _ = cls.objects.get_or_create(pk=1, defaults={'balance': 0, 'total_created': 0})
         return obj
 
+    def _add(self, delta, wallets, **extra):
+        updated = wallets.update(balance=F('balance') + delta, updated_at=timezone.now(), **extra)
+        self.refresh_from_db(fields=['balance', 'total_created', 'updated_at'])
+        # QuerySet.update() sends no post_save, so drop the cached singleton here.
+        invalidate_solo(type(self))
+        return bool(updated)
+
+    def credit(self, amount, minted=False):
+        """Add amount to the balance with an F() increment; minted coins also count towards total_created"""
+        extra = {'total_created': F('total_created') + amount} if minted else {}
+        return self._add(amount, type(self).objects.filter(pk=self.pk), **extra)
+
+    def debit(self, amount):
+        """Take amount from the balance; returns False, changing nothing, when the balance is short"""
+        return self._add(-amount, type(self).objects.filter(pk=self.pk, balance__gte=amount))
+
 
 class CoinWallet(models.Model):
     STATUS_ACTIVE = 'ACTIVE'
@@ -121,12 +204,50 @@ class CoinWallet(models.Model):
     last_updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    STR_RELATED = ('user',)
+    objects = StrRelatedManager()
+
     class Meta:
         db_table = 'coin_wallets'
         unique_together = [('user',)]
 
     def __str__(self):
-        return f"Wallet {self.pk} for {self.user.email}"
+        return f"Wallet {self.pk} for {self.user.email if self.user_id else '-'}"
+
+    def apply_transaction(self, *, txn_type, amount, source, customer=None, **extras):
+        """
+        Move amount coins in (CREDIT) or out (any other type) of this wallet and
+        log the CoinTransaction. The balance changes through a single
+        conditional F() update, so concurrent debits cannot both spend the same
+        coins. Returns None, writing nothing, when a debit exceeds the balance.
+        """
+        delta = amount if txn_type == CoinTransaction.TYPE_CREDIT else -amount
+        wallets = type(self).objects.filter(pk=self.pk)
+        with transaction.atomic():
+            now = timezone.now()
+            guarded = wallets if delta >= 0 else wallets.filter(balance__gte=-delta)
+            if not guarded.update(balance=F('balance') + delta, last_updated_at=now):
+                self.balance = wallets.values_list('balance', flat=True).first() or 0
+                return None
+            after = wallets.values_list('balance', flat=True).get()
+            before = after - delta
+            self.balance, self.last_updated_at = after, now
+            return CoinTransaction.objects.create(
+                wallet=self,
+                customer=customer or self.user,
+                txn_type=txn_type,
+                amount=amount,
+                before_balance=before,
+                after_balance=after,
+                source=source,
+                **extras,
+            )
+
+
+def _generate_txn_id():
+    # uuid7 (Python 3.14+) is time ordered, so the unique index stays append-mostly.
+    make_uuid = getattr(uuid, 'uuid7', uuid.uuid4)
+    return f"TXN{make_uuid().hex.upper()}"
 
 
 class CoinTransaction(models.Model):
@@ -158,7 +279,7 @@ class CoinTransaction(models.Model):
     ]
 
     id = models.BigAutoField(primary_key=True)
-    txn_id = models.CharField(max_length=50, unique=True)
+    txn_id = models.CharField(max_length=50, unique=True, default=_generate_txn_id, editable=False)
     wallet = models.ForeignKey(CoinWallet, on_delete=models.CASCADE, related_name='transactions')
     customer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='coin_transactions')
     txn_type = models.CharField(max_length=20, choices=TYPE_CHOICES)
@@ -177,6 +298,12 @@ class CoinTransaction(models.Model):
     class Meta:
         db_table = 'coin_transactions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['customer', '-created_at']),
+            models.Index(fields=['wallet', '-created_at']),
+            models.Index(fields=['txn_type']),
+            models.Index(fields=['source']),
+        ]
 
     def __str__(self):
         return f"{self.txn_id} {self.txn_type} {self.amount}"
@@ -288,20 +415,32 @@ class GoogleAuthConfig(models.Model):
         db_table = 'google_auth_config'
 
     @classmethod
-    def get_solo(cls):
+    def get_solo(cls, cached=True):
+        if cached:
+            return _cached_solo(cls)
         obj, _ = cls.objects.get_or_create(pk=1)
         return obj
 
+    def save(self, *args, **kwargs):
+        # allowed_domains may have changed; re-parse on next use.
+        self.__dict__.pop('_allowed_domain_set', None)
+        super().save(*args, **kwargs)
+
+    @cached_property
+    def _allowed_domain_set(self):
+        return frozenset(d.strip().lower() for d in (self.allowed_domains or '').split(',') if d.strip())
+
     def domain_allowed(self, email: str) -> bool:
-        domains = [d.strip().lower() for d in (self.allowed_domains or '').split(',') if d.strip()]
+        domains = self._allowed_domain_set
         if not domains:
             return True
-        try:
-            validate_email(email)
-        except ValidationError:
+        # Only the domain part matters here; full address validation belongs
+        # to the forms. Require a non-empty local part and domain.
+        email = email or ''
+        at = email.rfind('@')
+        if at <= 0 or at == len(email) - 1:
             return False
-        domain = (email.split('@')[-1] or '').lower()
-        return domain in domains
+        return email[at + 1:].lower() in domains
 
     def is_role_allowed(self, role: str) -> bool:
         role = (role or '').upper()
@@ -343,6 +482,13 @@ class GoogleLoginLog(models.Model):
         return "No expiry"
 
 
+class DeferHeavyFieldsManager(StrRelatedManager):
+    """Manager whose list_qs() leaves the model's HEAVY_FIELDS TextFields out of the SELECT"""
+
+    def list_qs(self):
+        return self.get_queryset().defer(*self.model.HEAVY_FIELDS)
+
+
 class PricingPlanPurchase(models.Model):
     STATUS_ACTIVE = 'ACTIVE'
     STATUS_EXPIRED = 'EXPIRED'
@@ -389,12 +535,21 @@ class PricingPlanPurchase(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_ACTIVE)
     notes = models.TextField(blank=True, default='')
 
+    # Large columns skipped by objects.list_qs() on listing pages.
+    HEAVY_FIELDS = ('plan_snapshot', 'notes')
+    STR_RELATED = ('user',)
+
+    objects = DeferHeavyFieldsManager()
+
     class Meta:
         db_table = 'pricing_plan_purchases'
         ordering = ['-purchased_at']
+        indexes = [
+            models.Index(fields=['user', 'status']),
+        ]
 
     def __str__(self):
-        return f"{self.plan_name} for {self.user.email}"
+        return f"{self.plan_name} for {self.user.email if self.user_id else '-'}"
 
     def is_expired(self):
         return bool(self.valid_until and timezone.now() > self.valid_until)
@@ -402,6 +557,10 @@ class PricingPlanPurchase(models.Model):
     def computed_status(self):
         return self.STATUS_EXPIRED if self.is_expired() else self.status
 
+    def mark_expired(self):
+        self.status = self.STATUS_EXPIRED
+        self.save(update_fields=['status'])
+
 
 class AIRequestLog(models.Model):
     id = models.BigAutoField(primary_key=True)
@@ -422,11 +581,28 @@ class AIRequestLog(models.Model):
     class Meta:
         db_table = 'ai_request_logs'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['status']),
+        ]
 
     def __str__(self):
         return f"{self.customer_name or self.customer_id} - {self.service}"
 
 
+def _populate_customer_denorm(submission):
+    """Copy the owner's code and name onto a submission, loading the user at most once"""
+    if submission.customer_id and submission.customer_name:
+        return
+    if not submission.user_id:
+        return
+    user = submission.user
+    if not submission.customer_id:
+        submission.customer_id = getattr(user, 'customer_code', None) or getattr(user, 'employee_id', None) or ''
+    if not submission.customer_name:
+        submission.customer_name = user.get_full_name()
+
+
 class JobCheckingSubmission(models.Model):
     STATUS_PENDING = 'PENDING'
     STATUS_SUCCESS = 'SUCCESS'
@@ -461,9 +637,18 @@ class JobCheckingSubmission(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Large columns skipped by objects.list_qs() on listing pages.
+    HEAVY_FIELDS = ('extracted_text', 'ai_prompt', 'ai_summary')
+
+    objects = DeferHeavyFieldsManager()
+
     class Meta:
         db_table = 'job_checking_submissions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['status']),
+        ]
 
     def __str__(self):
         return self.submission_id
@@ -472,17 +657,14 @@ class JobCheckingSubmission(models.Model):
         if self.submission_id:
             return self.submission_id
         base = timezone.now().strftime('JCS%Y%m%d%H%M%S')
-        suffix = random.randint(100, 999)
+        suffix = secrets.token_hex(3).upper()
         self.submission_id = f"{base}{suffix}"
         return self.submission_id
 
     def save(self, *args, **kwargs):
         if not self.submission_id:
             self.generate_submission_id()
-        if not self.customer_id and self.user:
-            self.customer_id = getattr(self.user, 'customer_code', None) or getattr(self.user, 'employee_id', None) or ''
-        if not self.customer_name and self.user:
-            self.customer_name = self.user.get_full_name()
+        _populate_customer_denorm(self)
         super().save(*args, **kwargs)
 
 
@@ -524,9 +706,18 @@ class StructureGenerationSubmission(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Large columns skipped by objects.list_qs() on listing pages.
+    HEAVY_FIELDS = ('ai_prompt', 'ai_structure', 'summary', 'marking_criteria', 'merit_criteria')
+
+    objects = DeferHeavyFieldsManager()
+
     class Meta:
         db_table = 'structure_generation_submissions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['status']),
+        ]
 
     def __str__(self):
         return self.submission_id
@@ -535,17 +726,14 @@ class StructureGenerationSubmission(models.Model):
         if self.submission_id:
             return self.submission_id
         base = timezone.now().strftime('SGS%Y%m%d%H%M%S')
-        suffix = random.randint(100, 999)
+        suffix = secrets.token_hex(3).upper()
         self.submission_id = f"{base}{suffix}"
         return self.submission_id
 
     def save(self, *args, **kwargs):
         if not self.submission_id:
             self.generate_submission_id()
-        if not self.customer_id and self.user:
-            self.customer_id = getattr(self.user, 'customer_code', None) or getattr(self.user, 'employee_id', None) or ''
-        if not self.customer_name and self.user:
-            self.customer_name = self.user.get_full_name()
+        _populate_customer_denorm(self)
         super().save(*args, **kwargs)
 
 
@@ -590,9 +778,21 @@ class ContentGenerationSubmission(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Large columns skipped by objects.list_qs() on listing pages.
+    HEAVY_FIELDS = (
+        'generated_content', 'final_content', 'references_text',
+        'citations_text', 'structure_guidelines',
+    )
+
+    objects = DeferHeavyFieldsManager()
+
     class Meta:
         db_table = 'content_generation_submissions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['status']),
+        ]
 
     def __str__(self):
         return self.submission_id
@@ -600,7 +800,7 @@ class ContentGenerationSubmission(models.Model):
     def generate_submission_ids(self):
         if not self.submission_id:
             base = timezone.now().strftime('CGS%Y%m%d%H%M%S')
-            suffix = random.randint(100, 999)
+            suffix = secrets.token_hex(3).upper()
             self.submission_id = f"{base}{suffix}"
         if not self.base_submission_id:
             self.base_submission_id = self.submission_id
@@ -608,11 +808,25 @@ class ContentGenerationSubmission(models.Model):
 
     def save(self, *args, **kwargs):
         self.generate_submission_ids()
-        if not self.customer_id and self.user:
-            self.customer_id = getattr(self.user, 'customer_code', None) or getattr(self.user, 'employee_id', None) or ''
-        if not self.customer_name and self.user:
-            self.customer_name = self.user.get_full_name()
+        _populate_customer_denorm(self)
         super().save(*args, **kwargs)
+
+
+class AnnouncementQuerySet(models.QuerySet):
+    def for_role(self, role):
+        """Queryset counterpart of Announcement.is_for_role()"""
+        return self.filter(visibility__in=[self.model.VISIBILITY_ALL, role])
+
+    def visible_now(self, reference_time=None):
+        """Queryset counterpart of Announcement.is_visible_now()"""
+        reference_time = reference_time or timezone.now()
+        return self.filter(
+            Q(start_at__isnull=True) | Q(start_at__lte=reference_time),
+            Q(end_at__isnull=True) | Q(end_at__gte=reference_time),
+            is_active=True,
+        )
+
+
 class Announcement(models.Model):
     TYPE_INFO = 'INFO'
     TYPE_WARNING = 'WARNING'
@@ -667,8 +881,13 @@ class Announcement(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AnnouncementQuerySet.as_manager()
+
     class Meta:
         ordering = ['-start_at', '-created_at']
+        indexes = [
+            models.Index(fields=['is_active', 'start_at', 'end_at']),
+        ]
 
     def __str__(self):
         return self.title
@@ -677,17 +896,19 @@ class Announcement(models.Model):
         """Return computed status string for UI/state."""
         if not self.is_active:
             return self.STATUS_INACTIVE
+        start_at, end_at = self.start_at, self.end_at
+        if not (start_at or end_at):
+            return self.STATUS_ACTIVE
         reference_time = reference_time or timezone.now()
-        if self.start_at and self.start_at > reference_time:
+        if start_at and start_at > reference_time:
             return self.STATUS_SCHEDULED
-        if self.end_at and self.end_at < reference_time:
+        if end_at and end_at < reference_time:
             return self.STATUS_EXPIRED
         return self.STATUS_ACTIVE
 
     def is_for_role(self, role):
-        if self.visibility == self.VISIBILITY_ALL:
-            return True
-        return self.visibility == role
+        visibility = self.visibility
+        return visibility == self.VISIBILITY_ALL or visibility == role
 
     def is_visible_now(self, reference_time=None):
         """Return True if announcement should be shown right now."""
@@ -725,11 +946,14 @@ class ContentAccessSetting(models.Model):
         default=MODE_APPROVAL_OR_SLIP,
     )
 
+    STR_RELATED = ('marketing_user',)
+    objects = StrRelatedManager()
+
     class Meta:
         db_table = 'content_access_settings'
 
     def __str__(self):
-        return f"{self.marketing_user.email} - {self.mode}"
+        return f"{self.marketing_user.email if self.marketing_user_id else '-'} - {self.mode}"
 
     @classmethod
     def for_user(cls, user):
@@ -745,6 +969,9 @@ class ContentAccessSetting(models.Model):
             return None
 
 
+RECEIPT_BULK_BATCH_SIZE = 500
+
+
 class AnnouncementReceipt(models.Model):
     announcement = models.ForeignKey(
         Announcement,
@@ -762,6 +989,10 @@ class AnnouncementReceipt(models.Model):
     class Meta:
         unique_together = ('announcement', 'user')
         ordering = ['-announcement__start_at']
+        indexes = [
+            # unique_together leads with announcement; receipt lookups start from the user.
+            models.Index(fields=['user', 'announcement']),
+        ]
 
     def mark_seen(self, timestamp=None, save=True):
         if self.seen_at:
@@ -786,6 +1017,41 @@ class AnnouncementReceipt(models.Model):
             self.pk = _generate_bigint_id()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_insert(cls, receipts):
+        """Insert unsaved receipts in batches; existing (announcement, user) pairs are skipped"""
+        # bulk_create() bypasses save(), so assign ids here.
+        for receipt in receipts:
+            if not receipt.pk:
+                receipt.pk = _generate_bigint_id()
+        with transaction.atomic():
+            return cls.objects.bulk_create(receipts, batch_size=RECEIPT_BULK_BATCH_SIZE, ignore_conflicts=True)
+
+
+# Per-role sidebar rows are cached under a version number that any MenuItem
+# write bumps (see superadmin.signals), which orphans every cached role at once.
+# The default cache is per process, so the bump only reaches the worker that
+# saved; the short timeout bounds how long the others serve the old menu.
+MENU_CACHE_VERSION_KEY = 'menu_items:v'
+MENU_CACHE_TIMEOUT = 30
+
+# url_name -> reversed path, or None when it does not resolve. The URLconf is
+# fixed for the life of the process, so entries never go stale.
+_MENU_URL_CACHE = {}
+
+
+def _resolve_menu_url(url_name):
+    try:
+        return _MENU_URL_CACHE[url_name]
+    except KeyError:
+        pass
+    try:
+        url = reverse(url_name)
+    except NoReverseMatch:
+        url = None
+    _MENU_URL_CACHE[url_name] = url
+    return url
+
 
 class MenuItem(models.Model):
     ROLE_SUPERADMIN = 'SUPERADMIN'
@@ -813,85 +1079,130 @@ class MenuItem(models.Model):
 
     @classmethod
     def _default_menu(cls):
-        return {
-            cls.ROLE_SUPERADMIN: [
-                ('Welcome', 'superadmin:welcome', 'fas fa-home', 0, True),
-                ('Dashboard', 'superadmin:dashboard', 'fas fa-chart-bar', 1, False),
-                ('Statistics', 'superadmin:statistics', 'fas fa-chart-pie', 2, False),
-                ('All Jobs', 'superadmin:all_jobs', 'fas fa-briefcase', 3, False),
-                ('New Jobs', 'superadmin:new_jobs', 'fas fa-bell', 4, False),
-                ('Tickets', 'tickets:superadmin-ticket-list', 'fas fa-ticket-alt', 5, False),
-                ('Holiday Management', 'holidays:list', 'fas fa-umbrella-beach', 6, False),
-                ('User Management', 'superadmin:user_management', 'fas fa-users-cog', 7, False),
-                ('Form Management', 'superadmin:form_management', 'fas fa-clipboard-list', 8, False),
-                ('Permission Management', 'superadmin:permission_management', 'fas fa-user-shield', 9, False),
-                ('Notice Management', 'superadmin:announcement_list', 'fas fa-bullhorn', 10, False),
-                ('Menu Management', 'superadmin:menu_management', 'fas fa-list', 11, False),
-                ('Content Management', 'superadmin:content_management', 'fas fa-lock-open', 12, False),
-                ('Settings', 'superadmin:settings', 'fas fa-sliders-h', 13, False),
-                ('Activity Tracking', 'superadmin:activity_tracking', 'fas fa-stream', 14, False),
-                ('User Time-on-Page', 'superadmin:activity_analytics', 'fas fa-chart-line', 15, False),
-                ('Error Management', 'superadmin:error_management', 'fas fa-bug', 16, False),
-                ('Backup', 'superadmin:backup_center', 'fas fa-database', 17, False),
-                ('User Approval', 'approvals:user_approval_list', 'fas fa-user-check', 18, False),
-                ('Profile Updates', 'approvals:profile_update_list', 'fas fa-edit', 19, False),
-                ('Customer Management System', 'superadmin:customer_management', 'fas fa-user-tie', 20, False),
-                ('Customer Account Management', 'superadmin:customer_accounts', 'fas fa-id-card', 21, False),
-                ('Coin / Wallet Management', 'superadmin:customer_wallets', 'fas fa-wallet', 22, False),
-                ('Pricing Plan Management', 'superadmin:customer_pricing', 'fas fa-tags', 23, False),
-                ('AI Service Configuration', 'superadmin:customer_ai_config', 'fas fa-microchip', 24, False),
-                ('AI Request Log', 'superadmin:customer_ai_logs', 'fas fa-clipboard-list', 25, False),
-                ('Job Checking Submissions', 'superadmin:customer_job_checks', 'fas fa-file-alt', 26, False),
-                ('Structure Generation Management', 'superadmin:customer_structures', 'fas fa-sitemap', 27, False),
-                ('Content Generation Management', 'superadmin:customer_contents', 'fas fa-file-signature', 28, False),
-                ('Customer Ticket Management', 'superadmin:customer_tickets', 'fas fa-ticket-alt', 29, False),
-                ('Meeting Management', 'superadmin:customer_meetings', 'fas fa-handshake', 30, False),
-                ('Booking Management', 'superadmin:customer_bookings', 'fas fa-calendar-check', 31, False),
-                ('Customer Analytics Dashboard', 'superadmin:customer_analytics', 'fas fa-chart-pie', 32, False),
-            ],
-            cls.ROLE_MARKETING: [
-                ('Welcome', 'marketing:welcome', 'fas fa-home', 0, True),
-                ('Dashboard', 'marketing:dashboard', 'fas fa-chart-line', 1, False),
-                ('Statistics', 'marketing:statistics', 'fas fa-chart-pie', 2, False),
-                ('All Projects', 'marketing:all_projects', 'fas fa-folder-open', 3, False),
-                ('Create Job', 'marketing:create_job', 'fas fa-plus-circle', 4, False),
-                ('My Tickets', 'tickets:marketing-ticket-list', 'fas fa-ticket-alt', 5, False),
-                ('Create Ticket', 'tickets:marketing-ticket-create', 'fas fa-plus-square', 6, False),
-                ('Holiday Calendar', 'holidays:list', 'fas fa-umbrella-beach', 7, False),
-            ],
-        }
+        return _DEFAULT_MENU
 
     @classmethod
     def ensure_defaults(cls, role):
-        defaults = cls._default_menu().get(role, [])
-        for label, url_name, icon, position, is_fixed in defaults:
-            cls.objects.get_or_create(
+        defaults = cls._default_menu().get(role, ())
+        existing = set(cls.objects.filter(role=role).values_list('url_name', flat=True))
+        missing = [
+            cls(
                 role=role,
                 url_name=url_name,
-                defaults={
-                    'label': label,
-                    'icon_class': icon,
-                    'position': position,
-                    'is_fixed': is_fixed,
-                    'is_active': True,
-                },
+                label=label,
+                icon_class=icon,
+                position=position,
+                is_fixed=is_fixed,
+                is_active=True,
             )
+            for label, url_name, icon, position, is_fixed in defaults
+            if url_name not in existing
+        ]
+        if missing:
+            cls.objects.bulk_create(missing, ignore_conflicts=True)
+            # bulk_create() sends no post_save, so drop cached menus here.
+            cls.invalidate_menu_cache()
+
+    # Roles whose defaults this process has already seeded.
+    _defaults_seeded = set()
 
     @classmethod
     def ordered_for_role(cls, role):
         try:
-            cls.ensure_defaults(role)
+            if role not in cls._defaults_seeded:
+                cls.ensure_defaults(role)
+                cls._defaults_seeded.add(role)
             qs = cls.objects.filter(role=role, is_active=True).order_by('position', 'label')
 
             valid_items = []
             for item in qs:
-                try:
-                    reverse(item.url_name)
+                item.url = _resolve_menu_url(item.url_name)
+                if item.url is not None:
                     valid_items.append(item)
-                except NoReverseMatch:
-                    continue
             return valid_items
         except Exception:
             # If the menu collection/table is missing or another DB issue occurs,
             # fail soft and return an empty menu.
             return []
+
+    @classmethod
+    def for_role(cls, role):
+        """Cached ordered_for_role() as plain dicts for the sidebar templates"""
+        # Seed with a timestamp so a lost version key never revives stale entries.
+        version = cache.get_or_set(MENU_CACHE_VERSION_KEY, time.time_ns(), None)
+        key = f'menu_items:{role}:{version}'
+        items = cache.get(key)
+        if items is None:
+            items = [
+                {
+                    'label': item.label,
+                    'url_name': item.url_name,
+                    'url': item.url,
+                    'icon_class': item.icon_class,
+                    'position': item.position,
+                    'is_fixed': item.is_fixed,
+                }
+                for item in cls.ordered_for_role(role)
+            ]
+            # An empty list usually means the DB was unavailable; retry next time.
+            if items:
+                cache.set(key, items, MENU_CACHE_TIMEOUT)
+        return items
+
+    @classmethod
+    def invalidate_menu_cache(cls):
+        try:
+            cache.incr(MENU_CACHE_VERSION_KEY)
+        except ValueError:
+            cache.set(MENU_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+# Rows seeded by MenuItem.ensure_defaults():
+# (label, url_name, icon_class, position, is_fixed) per role.
+_DEFAULT_MENU = {
+    MenuItem.ROLE_SUPERADMIN: (
+        ('Welcome', 'superadmin:welcome', 'fas fa-home', 0, True),
+        ('Dashboard', 'superadmin:dashboard', 'fas fa-chart-bar', 1, False),
+        ('Statistics', 'superadmin:statistics', 'fas fa-chart-pie', 2, False),
+        ('All Jobs', 'superadmin:all_jobs', 'fas fa-briefcase', 3, False),
+        ('New Jobs', 'superadmin:new_jobs', 'fas fa-bell', 4, False),
+        ('Tickets', 'tickets:superadmin-ticket-list', 'fas fa-ticket-alt', 5, False),
+        ('Holiday Management', 'holidays:list', 'fas fa-umbrella-beach', 6, False),
+        ('User Management', 'superadmin:user_management', 'fas fa-users-cog', 7, False),
+        ('Form Management', 'superadmin:form_management', 'fas fa-clipboard-list', 8, False),
+        ('Permission Management', 'superadmin:permission_management', 'fas fa-user-shield', 9, False),
+        ('Notice Management', 'superadmin:announcement_list', 'fas fa-bullhorn', 10, False),
+        ('Menu Management', 'superadmin:menu_management', 'fas fa-list', 11, False),
+        ('Content Management', 'superadmin:content_management', 'fas fa-lock-open', 12, False),
+        ('Settings', 'superadmin:settings', 'fas fa-sliders-h', 13, False),
+        ('Activity Tracking', 'superadmin:activity_tracking', 'fas fa-stream', 14, False),
+        ('User Time-on-Page', 'superadmin:activity_analytics', 'fas fa-chart-line', 15, False),
+        ('Error Management', 'superadmin:error_management', 'fas fa-bug', 16, False),
+        ('Backup', 'superadmin:backup_center', 'fas fa-database', 17, False),
+        ('User Approval', 'approvals:user_approval_list', 'fas fa-user-check', 18, False),
+        ('Profile Updates', 'approvals:profile_update_list', 'fas fa-edit', 19, False),
+        ('Customer Management System', 'superadmin:customer_management', 'fas fa-user-tie', 20, False),
+        ('Customer Account Management', 'superadmin:customer_accounts', 'fas fa-id-card', 21, False),
+        ('Coin / Wallet Management', 'superadmin:customer_wallets', 'fas fa-wallet', 22, False),
+        ('Pricing Plan Management', 'superadmin:customer_pricing', 'fas fa-tags', 23, False),
+        ('AI Service Configuration', 'superadmin:customer_ai_config', 'fas fa-microchip', 24, False),
+        ('AI Request Log', 'superadmin:customer_ai_logs', 'fas fa-clipboard-list', 25, False),
+        ('Job Checking Submissions', 'superadmin:customer_job_checks', 'fas fa-file-alt', 26, False),
+        ('Structure Generation Management', 'superadmin:customer_structures', 'fas fa-sitemap', 27, False),
+        ('Content Generation Management', 'superadmin:customer_contents', 'fas fa-file-signature', 28, False),
+        ('Customer Ticket Management', 'superadmin:customer_tickets', 'fas fa-ticket-alt', 29, False),
+        ('Meeting Management', 'superadmin:customer_meetings', 'fas fa-handshake', 30, False),
+        ('Booking Management', 'superadmin:customer_bookings', 'fas fa-calendar-check', 31, False),
+        ('Customer Analytics Dashboard', 'superadmin:customer_analytics', 'fas fa-chart-pie', 32, False),
+    ),
+    MenuItem.ROLE_MARKETING: (
+        ('Welcome', 'marketing:welcome', 'fas fa-home', 0, True),
+        ('Dashboard', 'marketing:dashboard', 'fas fa-chart-line', 1, False),
+        ('Statistics', 'marketing:statistics', 'fas fa-chart-pie', 2, False),
+        ('All Projects', 'marketing:all_projects', 'fas fa-folder-open', 3, False),
+        ('Create Job', 'marketing:create_job', 'fas fa-plus-circle', 4, False),
+        ('My Tickets', 'tickets:marketing-ticket-list', 'fas fa-ticket-alt', 5, False),
+        ('Create Ticket', 'tickets:marketing-ticket-create', 'fas fa-plus-square', 6, False),
+        ('Holiday Calendar', 'holidays:list', 'fas fa-umbrella-beach', 7, False),
+    ),
+}
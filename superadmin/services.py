@@ -1,21 +1,32 @@
 import csv
 import io
 import json
+import logging
+import shutil
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import date, datetime, time
-from decimal import Decimal
-from typing import Dict, Iterable, List, Sequence
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+from typing import BinaryIO, Dict, Iterable, List, Sequence
 from xml.sax.saxutils import escape
 
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist
-from django.db import DatabaseError, models
+from django.db import DatabaseError, connection, connections, models, transaction
 from django.utils import timezone
 from django.utils.text import slugify
 
-from .models import Announcement, AnnouncementReceipt
+from accounts.models import User
+from jobs.models import Job
+from profiles.models import ProfileUpdateRequest
+from .models import Announcement, AnnouncementReceipt, SiteCounters
+
+logger = logging.getLogger(__name__)
 
 ANNOUNCEMENT_STATUS_LABELS = {
     Announcement.STATUS_ACTIVE: 'Active',
@@ -50,13 +61,13 @@ def get_visible_announcements_for_user(user) -> List[Announcement]:
     now = timezone.now()
 
     try:
-        raw_candidates = Announcement.objects.select_related('created_by').order_by('-start_at', '-created_at')
-        candidates = []
-        for announcement in raw_candidates:
-            if not getattr(announcement, 'pk', None):
-                continue
-            if announcement.is_for_role(role) and announcement.is_visible_now(now):
-                candidates.append(announcement)
+        candidates = [
+            announcement for announcement in (
+                Announcement.objects.for_role(role).visible_now(now)
+                .select_related('created_by').order_by('-start_at', '-created_at')
+            )
+            if getattr(announcement, 'pk', None)
+        ]
         if not candidates:
             return []
 
@@ -69,39 +80,115 @@ def get_visible_announcements_for_user(user) -> List[Announcement]:
             )
         }
 
+        # visible_now() only returns announcements that are live right now, so
+        # every candidate shares the active status and its presentation.
+        active_label = ANNOUNCEMENT_STATUS_LABELS[Announcement.STATUS_ACTIVE]
+        active_badge = ANNOUNCEMENT_STATUS_BADGES[Announcement.STATUS_ACTIVE]
+
         visible_announcements = []
+        unseen_ids = []
+        new_receipts = []
         for announcement in candidates:
             receipt = receipts.get(announcement.pk)
             if receipt and receipt.dismissed_at:
                 continue
             if receipt:
-                receipt.mark_seen()
+                if receipt.mark_seen(now, save=False):
+                    unseen_ids.append(receipt.pk)
             else:
-                receipt = AnnouncementReceipt.objects.create(
+                receipt = AnnouncementReceipt(
                     announcement=announcement,
                     user=user,
                     seen_at=now,
                 )
+                new_receipts.append(receipt)
             announcement.user_receipt = receipt
-            announcement.current_status = announcement.status(now)
-            announcement.status_label = ANNOUNCEMENT_STATUS_LABELS.get(
-                announcement.current_status,
-                announcement.current_status,
-            )
-            announcement.status_badge_class = ANNOUNCEMENT_STATUS_BADGES.get(
-                announcement.current_status,
-                'bg-secondary',
-            )
+            announcement.current_status = Announcement.STATUS_ACTIVE
+            announcement.status_label = active_label
+            announcement.status_badge_class = active_badge
             announcement.type_badge_class = ANNOUNCEMENT_TYPE_BADGES.get(
                 announcement.type,
                 'bg-secondary',
             )
             visible_announcements.append(announcement)
+        # Record every receipt change in at most two writes, committed together.
+        if unseen_ids or new_receipts:
+            with transaction.atomic():
+                if unseen_ids:
+                    AnnouncementReceipt.objects.filter(pk__in=unseen_ids).update(seen_at=now)
+                if new_receipts:
+                    AnnouncementReceipt.bulk_insert(new_receipts)
         return visible_announcements
     except DatabaseError:
         return []
 
 
+# Pending counts shown in the superadmin navigation are kept in the SiteCounters
+# row; writers recount the affected column and drop the cached copy.
+NOTIFICATION_COUNTS_CACHE_KEY = 'notif_counts:superadmin'
+NOTIFICATION_COUNTS_CACHE_TIMEOUT = 30
+
+
+def _pending_querysets():
+    return {
+        # Pending user approvals
+        'pending_user_approvals': User.objects.filter(
+            role='MARKETING',
+            is_approved=False,
+            is_active=True
+        ),
+        # Pending profile update requests
+        'pending_profile_updates': ProfileUpdateRequest.objects.filter(
+            status='PENDING'
+        ),
+        # New jobs (pending approval)
+        'new_jobs_count': Job.objects.filter(
+            is_approved=False
+        ),
+    }
+
+
+def _compute_notification_counts(keys=None):
+    querysets = _pending_querysets()
+    if keys:
+        querysets = {key: querysets[key] for key in keys}
+    if connection.vendor == 'djongo':
+        # Djongo cannot translate nested scalar subqueries; count separately.
+        return {key: qs.count() for key, qs in querysets.items()}
+
+    # One round-trip: SELECT (SELECT COUNT(*) ...), (SELECT COUNT(*) ...), ...
+    columns, params = [], []
+    for qs in querysets.values():
+        sql, qs_params = qs.order_by().values('pk').query.sql_with_params()
+        columns.append(f'(SELECT COUNT(*) FROM ({sql}) counted)')
+        params.extend(qs_params)
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(columns)}", params)
+        row = cursor.fetchone()
+    return dict(zip(querysets.keys(), row))
+
+
+def invalidate_notification_counts():
+    cache.delete(NOTIFICATION_COUNTS_CACHE_KEY)
+
+
+def refresh_site_counters(*keys):
+    """Recount the given SiteCounters columns (all when none given) and drop the cached copy"""
+    counts = _compute_notification_counts(keys)
+    if not SiteCounters.objects.filter(pk=SiteCounters.SOLO_PK).update(**counts):
+        SiteCounters.objects.get_or_create(pk=SiteCounters.SOLO_PK, defaults=_compute_notification_counts())
+    invalidate_notification_counts()
+
+
+def load_site_counters():
+    """Read the SiteCounters row, creating it on first use"""
+    counters = SiteCounters.objects.filter(pk=SiteCounters.SOLO_PK).values(*SiteCounters.COUNTER_FIELDS).first()
+    if counters is None:
+        refresh_site_counters()
+        counters = SiteCounters.objects.filter(pk=SiteCounters.SOLO_PK).values(*SiteCounters.COUNTER_FIELDS).first()
+    return counters
+
+
 # Backup / export helpers
 DEFAULT_BACKUP_APPS = getattr(
     settings,
@@ -122,34 +209,94 @@ DEFAULT_BACKUP_APPS = getattr(
         'tickets',
     ],
 )
+# None means "no restriction", matching an empty BACKUP_EXPORT_APPS setting.
+_BACKUP_APPS_SET = frozenset(DEFAULT_BACKUP_APPS) if DEFAULT_BACKUP_APPS else None
 
 
 @dataclass
 class BackupExportResult:
     filename: str
     content_type: str
-    content: bytes
+    # Readable binary file positioned at the start; the caller closes it
+    # (FileResponse does so once the download has been sent).
+    content: BinaryIO
 
 
 class BackupExportError(Exception):
     """Raised when backup/export generation fails."""
 
 
+BACKUP_COUNTS_CACHE_KEY = 'backup:approx_counts'
+BACKUP_COUNTS_CACHE_TIMEOUT = 300
+EXPORT_CHUNK_SIZE = 2000
+BACKUP_EXPORT_WORKERS = 4
+EXPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+EXCEL_MAX_COLUMNS = 16384
+EXCEL_MAX_CELL_CHARS = 32767
+
+# Related columns the Job export reads for _job_row_transform.
+JOB_EXPORT_RELATED_VALUES = tuple(
+    f'{prefix}{name}'
+    for prefix in ('created_by__', 'jobsummary__approved_by__')
+    for name in ('id', 'first_name', 'last_name', 'email')
+) + ('jobsummary__is_approved', 'jobsummary__approved_at')
+
+
+def _compute_approx_counts(models_list):
+    """Approximate row counts keyed by db_table, from catalog metadata where the backend has it"""
+    tables = {model._meta.db_table: model for model in models_list}
+    counts = {}
+    if connection.vendor == 'postgresql':
+        # One catalog query; reltuples is -1 for never-analysed tables.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, reltuples::bigint FROM pg_class WHERE relkind = 'r' AND relname = ANY(%s)",
+                [list(tables)],
+            )
+            counts = {name: count for name, count in cursor.fetchall() if count >= 0}
+    elif connection.vendor == 'djongo':
+        # Collection metadata counts; no documents are scanned.
+        connection.ensure_connection()
+        database = connection.connection
+        for table in tables:
+            try:
+                counts[table] = database[table].estimated_document_count()
+            except Exception:
+                continue
+    for table, model in tables.items():
+        if table not in counts:
+            try:
+                counts[table] = model.objects.count()
+            except Exception:
+                counts[table] = None
+    return counts
+
+
+def _approx_counts(models_list):
+    counts = cache.get(BACKUP_COUNTS_CACHE_KEY)
+    if counts is None:
+        try:
+            counts = _compute_approx_counts(models_list)
+        except DatabaseError:
+            counts = {}
+        cache.set(BACKUP_COUNTS_CACHE_KEY, counts, BACKUP_COUNTS_CACHE_TIMEOUT)
+    return counts
+
+
 def get_exportable_model_metadata():
     """Return metadata for all models allowed in backups."""
     metadata = []
-    for model in apps.get_models():
-        if model._meta.proxy or model._meta.abstract:
-            continue
+    exportable = [
+        model for model in apps.get_models()
+        if not (model._meta.proxy or model._meta.abstract)
+        and (_BACKUP_APPS_SET is None or model._meta.app_label in _BACKUP_APPS_SET)
+    ]
+    counts = _approx_counts(exportable)
+    for model in exportable:
         app_label = model._meta.app_label
-        if DEFAULT_BACKUP_APPS and app_label not in DEFAULT_BACKUP_APPS:
-            continue
         key = f'{app_label}.{model.__name__}'
         label = f"{model._meta.verbose_name_plural.title()}"
-        try:
-            record_count = model.objects.count()
-        except Exception:
-            record_count = None
+        record_count = counts.get(model._meta.db_table)
         if record_count is None:
             count_label = 'count unavailable'
         else:
@@ -186,22 +333,19 @@ def generate_backup_export(
         field_info = _get_model_fields(model)
         if not field_info:
             continue
-        queryset = model.objects.all()
         transform = None
+        extra_values = ()
         if meta['app_label'] == 'jobs' and model.__name__ == 'Job':
-            queryset = queryset.select_related(
-                'created_by',
-                'approved_by',
-                'jobsummary__approved_by',
-            )
             transform = _job_row_transform
+            extra_values = JOB_EXPORT_RELATED_VALUES
         entries.append({
             'key': key,
             'label': meta['label'],
             'model': model,
-            'queryset': queryset,
+            'queryset': model.objects.all(),
             'fields': field_info,
             'transform': transform,
+            'extra_values': extra_values,
         })
 
     if not entries:
@@ -210,7 +354,7 @@ def generate_backup_export(
     timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
 
     if export_format == 'csv':
-        content = _export_tables_to_csv(entries, start_date, end_date)
+        content = _spooled_file(_export_tables_to_csv, entries, start_date, end_date)
         return BackupExportResult(
             filename=f'cta_backup_{timestamp}.zip',
             content_type='application/zip',
@@ -218,7 +362,7 @@ def generate_backup_export(
         )
 
     if export_format == 'xlsx':
-        content = _export_tables_to_excel(entries, start_date, end_date)
+        content = _spooled_file(_export_tables_to_excel, entries, start_date, end_date)
         return BackupExportResult(
             filename=f'cta_backup_{timestamp}.xlsx',
             content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
@@ -228,34 +372,92 @@ def generate_backup_export(
     raise BackupExportError(f'Unsupported export format: {export_format}')
 
 
-def _export_tables_to_csv(entries, start_date=None, end_date=None):
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
-        for entry in entries:
-            csv_buffer = io.StringIO()
-            writer = csv.DictWriter(csv_buffer, fieldnames=[field.name for field in entry['fields']])
-            writer.writeheader()
-            for row in _serialize_model_rows(
-                entry['model'],
-                entry['fields'],
-                start_date,
-                end_date,
-                queryset=entry.get('queryset'),
-                transform=entry.get('transform'),
-            ):
-                writer.writerow(row)
-            archive.writestr(f"{_safe_filename(entry['label'])}.csv", csv_buffer.getvalue())
-    buffer.seek(0)
-    return buffer.read()
-
-
-def _export_tables_to_excel(entries, start_date=None, end_date=None):
+def _spooled_file(write, *args):
+    """Call ``write(output, *args)`` on a temp file kept in memory up to EXPORT_SPOOL_MAX_BYTES, then rewind it"""
+    output = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES)
+    try:
+        write(output, *args)
+    except BaseException:
+        output.close()
+        raise
+    output.seek(0)
+    return output
+
+
+@contextmanager
+def _run_per_table(render, entries, start_date=None, end_date=None):
+    """
+    Run ``render`` for each entry on a worker pool, yielding futures in entry order.
+
+    On exit, even when the consumer fails part way, tables not yet started are
+    cancelled, running ones are waited for, and results the consumer did not
+    take (spooled files) are closed.
+    """
+    def task(entry):
+        try:
+            return render(entry, start_date, end_date)
+        finally:
+            # Each worker thread opened its own connection; release it.
+            connections.close_all()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(BACKUP_EXPORT_WORKERS, len(entries))))
+    futures = []
+    try:
+        futures.extend(pool.submit(task, entry) for entry in entries)
+        yield futures
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=True)
+        for future in futures:
+            if not future.cancelled() and future.exception() is None:
+                close = getattr(future.result(), 'close', None)
+                if close is not None:
+                    close()
+
+
+def _write_csv(output, entry, start_date=None, end_date=None):
+    # Encoded by hand: before Python 3.11 SpooledTemporaryFile lacks the
+    # readable()/writable()/seekable() methods io.TextIOWrapper needs.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([field.name for field in entry['fields']])
+    for count, row in enumerate(_entry_rows(entry, start_date, end_date), start=1):
+        writer.writerow(row)
+        if count % EXPORT_CHUNK_SIZE == 0:
+            output.write(buffer.getvalue().encode('utf-8'))
+            buffer.seek(0)
+            buffer.truncate()
+    output.write(buffer.getvalue().encode('utf-8'))
+
+
+def _render_csv_file(entry, start_date=None, end_date=None):
+    # Spooled so large tables rendered in parallel do not all sit in memory at once.
+    return _spooled_file(_write_csv, entry, start_date, end_date)
+
+
+def _export_tables_to_csv(output, entries, start_date=None, end_date=None):
+    with _run_per_table(_render_csv_file, entries, start_date, end_date) as futures, \
+            zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for entry, future in zip(entries, futures):
+            member = f"{_safe_filename(entry['label'])}.csv"
+            with future.result() as spool, archive.open(member, 'w', force_zip64=True) as raw:
+                shutil.copyfileobj(spool, raw)
+
+
+def _export_tables_to_excel(output, entries, start_date=None, end_date=None):
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+    if xlsxwriter is not None:
+        return _export_tables_to_xlsxwriter(output, xlsxwriter, entries, start_date, end_date)
+
     try:
         from openpyxl import Workbook
     except ImportError:
-        return _export_tables_to_excel_inline(entries, start_date, end_date)
+        return _export_tables_to_excel_inline(output, entries, start_date, end_date)
 
-    buffer = io.BytesIO()
     wb = Workbook()
     if wb.active:
         wb.remove(wb.active)
@@ -265,43 +467,104 @@ def _export_tables_to_excel(entries, start_date=None, end_date=None):
         ws = wb.create_sheet(title=sheet_title)
         headers = [field.name for field in entry['fields']]
         ws.append(headers)
-        for row in _serialize_model_rows(
-            entry['model'],
-            entry['fields'],
-            start_date,
-            end_date,
-            queryset=entry.get('queryset'),
-            transform=entry.get('transform'),
-        ):
-            ws.append([row.get(name) for name in headers])
-
-    wb.save(buffer)
-    buffer.seek(0)
-    return buffer.read()
-
-
-def _serialize_model_rows(model, fields, start_date=None, end_date=None, queryset=None, transform=None):
-    queryset = queryset or model.objects.all()
-    date_field = _detect_date_field(model)
+        for row in _entry_rows(entry, start_date, end_date):
+            ws.append(row)
+            # openpyxl reads a leading "=" as a formula; keep stored text as text.
+            for cell in ws[ws.max_row]:
+                if cell.data_type == 'f':
+                    cell.data_type = 's'
+
+    wb.save(output)
+
+
+def _export_tables_to_xlsxwriter(output, xlsxwriter, entries, start_date=None, end_date=None):
+    # constant_memory flushes each row to a temp file once written, so rows
+    # must be written top to bottom and only one row is held at a time.
+    # Stored text is written as text: a leading "=" must not become a live
+    # formula, nor a URL a hyperlink, nor a numeric string a number.
+    wb = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'use_zip64': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+        'strings_to_numbers': False,
+    })
+    used_titles = set()
+    for idx, entry in enumerate(entries, start=1):
+        sheet_title = _safe_sheet_title(entry['label'])
+        if sheet_title.lower() in used_titles:
+            sheet_title = f'{sheet_title[:25]}_{idx}'
+        used_titles.add(sheet_title.lower())
+        ws = wb.add_worksheet(sheet_title)
+        headers = [field.name for field in entry['fields']]
+        ws.write_row(0, 0, headers)
+        truncated = 0
+        for row_idx, row in enumerate(_entry_rows(entry, start_date, end_date), start=1):
+            # Cell by cell: write_row() abandons the rest of a row after an
+            # over-long string.
+            for col_idx, value in enumerate(row):
+                if isinstance(value, str) and len(value) > EXCEL_MAX_CELL_CHARS:
+                    truncated += 1
+                ws.write(row_idx, col_idx, value)
+        if truncated:
+            logger.warning(
+                'Backup export: %s cells in %s exceed the %s character Excel limit and were cut short; '
+                'use the CSV export for a complete copy',
+                truncated, entry['key'], EXCEL_MAX_CELL_CHARS,
+            )
+
+    wb.close()
+
+
+def _entry_rows(entry, start_date=None, end_date=None):
+    return _serialize_model_rows(
+        entry['model'],
+        entry['fields'],
+        start_date,
+        end_date,
+        queryset=entry.get('queryset'),
+        transform=entry.get('transform'),
+        extra_values=entry.get('extra_values', ()),
+    )
+
+
+def _serialize_model_rows(
+    model,
+    fields,
+    start_date=None,
+    end_date=None,
+    queryset=None,
+    transform=None,
+    extra_values=(),
+):
+    """
+    Yield one list of normalised cell strings per row, in ``fields`` order.
 
-    date_filtered_in_python = False
+    Rows are read as plain ``values()`` dicts (foreign keys by their ``_id``
+    column) so no model instances are built. ``transform`` may rewrite the
+    row in place; it receives the row, the raw values dict (which also carries
+    any ``extra_values`` lookups) and a field-name -> column-index map.
+    """
+    if queryset is None:
+        queryset = model.objects.all()
+    date_field = _detect_date_field(model)
+    columns = _value_columns(tuple(fields))
     if date_field and (start_date or end_date):
-        queryset = list(queryset)
-        date_filtered_in_python = True
+        queryset = queryset.filter(**_date_range_filters(date_field, start_date, end_date))
+    queryset = queryset.values(*columns, *extra_values)
+    positions = _field_positions(tuple(fields))
+    cells = tuple(zip(columns, _field_normalizers(tuple(fields))))
 
-    for obj in queryset:
-        if date_filtered_in_python and not _matches_date_range(obj, date_field, start_date, end_date):
-            continue
-        row = {}
-        for field in fields:
-            value = _get_field_value(obj, field)
-            row[field.name] = _normalize_value(value)
+    for values in queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        row = [normalize(values[column]) for column, normalize in cells]
         if transform:
-            row = transform(row, obj)
+            transform(row, values, positions)
         yield row
 
 
+@lru_cache(maxsize=None)
 def _get_model_fields(model):
+    """Concrete, non-m2m fields of ``model`` in declaration order (cached per model class)"""
     fields = []
     for field in model._meta.get_fields():
         if getattr(field, 'many_to_many', False):
@@ -311,27 +574,50 @@ def _get_model_fields(model):
         if not getattr(field, 'concrete', False):
             continue
         fields.append(field)
-    return fields
+    return tuple(fields)
+
+
+@lru_cache(maxsize=None)
+def _field_positions(fields):
+    return {field.name: idx for idx, field in enumerate(fields)}
+
 
+@lru_cache(maxsize=None)
+def _value_columns(fields):
+    """``values()`` column names for ``fields``; foreign keys by their ``_id`` attname"""
+    return tuple(field.attname for field in fields)
 
-def _get_field_value(instance, field):
-    if field.is_relation and (field.many_to_one or field.one_to_one):
-        return getattr(instance, f'{field.name}_id', None)
-    return getattr(instance, field.name, None)
 
+def _normalize_text(value):
+    return '' if value is None else str(value)
 
-def _normalize_value(value):
+
+def _normalize_temporal(value):
+    return '' if value is None else value.isoformat()
+
+
+def _normalize_json(value):
     if value is None:
         return ''
-    if isinstance(value, (datetime, date, time)):
-        return value.isoformat()
-    if isinstance(value, Decimal):
-        return str(value)
     if isinstance(value, (list, dict)):
         return json.dumps(value, default=str)
     return str(value)
 
 
+@lru_cache(maxsize=None)
+def _field_normalizers(fields):
+    """Per-column cell formatters chosen once from each field's type"""
+    normalizers = []
+    for field in fields:
+        if isinstance(field, (models.DateField, models.TimeField)):
+            normalizers.append(_normalize_temporal)
+        elif isinstance(field, models.JSONField):
+            normalizers.append(_normalize_json)
+        else:
+            normalizers.append(_normalize_text)
+    return tuple(normalizers)
+
+
 def _safe_filename(label):
     slug = slugify(label) or 'table'
     return slug[:64]
@@ -346,6 +632,7 @@ def _safe_sheet_title(label):
     return cleaned
 
 
+@lru_cache(maxsize=None)
 def _detect_date_field(model):
     candidates = [
         'created_at',
@@ -366,53 +653,56 @@ def _detect_date_field(model):
     return None
 
 
-def _matches_date_range(obj, field, start_date, end_date):
-    value = getattr(obj, field.name, None)
-    if value is None:
-        return False
-    if isinstance(field, models.DateTimeField):
-        if timezone.is_aware(value):
-            value_date = timezone.localtime(value).date()
-        else:
-            value_date = value.date()
-    else:
-        value_date = value
-    if start_date and value_date < start_date:
-        return False
-    if end_date and value_date > end_date:
-        return False
-    return True
-
-
-def _job_row_transform(row, job):
-    row['created_by'] = _format_user(getattr(job, 'created_by', None))
-    summary = getattr(job, 'jobsummary', None)
-    if summary and summary.is_approved:
-        row['is_approved'] = 'True'
-        row['approved_at'] = summary.approved_at.isoformat() if summary.approved_at else ''
-        row['approved_by'] = _format_user(summary.approved_by)
+def _date_range_filters(field, start_date, end_date):
+    """Lookups selecting rows whose ``field`` falls on a local date in the inclusive range"""
+    filters = {}
+    if not isinstance(field, models.DateTimeField):
+        if start_date:
+            filters[f'{field.name}__gte'] = start_date
+        if end_date:
+            filters[f'{field.name}__lte'] = end_date
+        return filters
+
+    def local_midnight(day):
+        value = datetime.combine(day, time.min)
+        return timezone.make_aware(value) if settings.USE_TZ else value
+
+    if start_date:
+        filters[f'{field.name}__gte'] = local_midnight(start_date)
+    if end_date:
+        filters[f'{field.name}__lt'] = local_midnight(end_date + timedelta(days=1))
+    return filters
+
+
+def _job_row_transform(row, values, positions):
+    row[positions['created_by']] = _format_user(values, 'created_by__')
+    if values.get('jobsummary__is_approved'):
+        approved_at = values.get('jobsummary__approved_at')
+        row[positions['is_approved']] = 'True'
+        row[positions['approved_at']] = approved_at.isoformat() if approved_at else ''
+        row[positions['approved_by']] = _format_user(values, 'jobsummary__approved_by__')
     else:
-        row['is_approved'] = row.get('is_approved', 'False') or 'False'
-        row['approved_at'] = ''
-        row['approved_by'] = ''
-    return row
+        row[positions['is_approved']] = row[positions['is_approved']] or 'False'
+        row[positions['approved_at']] = ''
+        row[positions['approved_by']] = ''
 
 
-def _format_user(user):
-    if not user:
+def _format_user(values, prefix):
+    if values.get(f'{prefix}id') is None:
         return ''
-    full_name = ''
-    if hasattr(user, 'get_full_name'):
-        full_name = user.get_full_name() or ''
-    full_name = full_name.strip()
-    if full_name:
-        return full_name
-    return getattr(user, 'email', str(user))
-
-
-def _export_tables_to_excel_inline(entries, start_date=None, end_date=None):
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+    full_name = f"{values.get(f'{prefix}first_name') or ''} {values.get(f'{prefix}last_name') or ''}".strip()
+    return full_name or values.get(f'{prefix}email') or ''
+
+
+def _render_sheet_xml(entry, start_date=None, end_date=None):
+    rows = [[field.name for field in entry['fields']]]
+    rows.extend(_entry_rows(entry, start_date, end_date))
+    return _build_sheet_xml(rows)
+
+
+def _export_tables_to_excel_inline(output, entries, start_date=None, end_date=None):
+    with _run_per_table(_render_sheet_xml, entries, start_date, end_date) as futures, \
+            zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
         sheet_rel_entries = []
         workbook_sheets = []
         for idx, entry in enumerate(entries, start=1):
@@ -427,20 +717,7 @@ def _export_tables_to_excel_inline(entries, start_date=None, end_date=None):
                 'sheetId': idx,
                 'rId': f'rId{idx}',
             })
-
-            headers = [field.name for field in entry['fields']]
-            rows = [headers]
-            for row in _serialize_model_rows(
-                entry['model'],
-                entry['fields'],
-                start_date,
-                end_date,
-                queryset=entry.get('queryset'),
-                transform=entry.get('transform'),
-            ):
-                rows.append([row.get(name, '') for name in headers])
-            sheet_xml = _build_sheet_xml(rows)
-            archive.writestr(f'xl/worksheets/sheet{idx}.xml', sheet_xml)
+            archive.writestr(f'xl/worksheets/sheet{idx}.xml', futures[idx - 1].result())
 
         archive.writestr('[Content_Types].xml', _build_content_types_xml(len(entries)))
         archive.writestr('_rels/.rels', _build_root_rels_xml())
@@ -448,8 +725,6 @@ def _export_tables_to_excel_inline(entries, start_date=None, end_date=None):
         archive.writestr('xl/workbook.xml', _build_workbook_xml(workbook_sheets))
         archive.writestr('xl/styles.xml', _build_styles_xml())
 
-    buffer.seek(0)
-    return buffer.read()
 
 
 def _build_content_types_xml(sheet_count):
@@ -527,11 +802,8 @@ def _build_sheet_xml(rows):
     for row_idx, row in enumerate(rows, start=1):
         cells = []
         for col_idx, value in enumerate(row, start=1):
-            col_ref = f'{_excel_column_name(col_idx)}{row_idx}'
-            text = escape(str(value)) if value is not None else ''
-            cells.append(
-                f'<c r="{col_ref}" t="inlineStr"><is><t>{text}</t></is></c>'
-            )
+            text = str(value).translate(_XML_ESCAPE) if value is not None else ''
+            cells.append(_INLINE_CELL_XML % (_COL_NAMES[col_idx], row_idx, text))
         sheet_rows.append(f'<row r="{row_idx}">{"".join(cells)}</row>')
     sheet_data = ''.join(sheet_rows)
     return (
@@ -549,3 +821,10 @@ def _excel_column_name(index):
         index, remainder = divmod(index - 1, 26)
         result.append(chr(65 + remainder))
     return ''.join(reversed(result))
+
+
+# Precomputed per-cell pieces for _build_sheet_xml, which runs once per exported cell.
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+# Indexed by 1-based column number, up to Excel's 16384-column limit.
+_COL_NAMES = [''] + [_excel_column_name(index) for index in range(1, EXCEL_MAX_COLUMNS + 1)]
+_INLINE_CELL_XML = '<c r="%s%d" t="inlineStr"><is><t>%s</t></is></c>'
@@ -0,0 +1,49 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from jobs.models import Job
+from profiles.models import ProfileUpdateRequest
+from .services import refresh_site_counters
+from .models import AdminWallet, GoogleAuthConfig, MenuItem, SystemSettings, invalidate_solo
+
+
+# Source model -> (SiteCounters column, fields whose change can move that count)
+_COUNTER_SOURCES = {
+    User: ('pending_user_approvals', {'role', 'is_approved', 'is_active'}),
+    Job: ('new_jobs_count', {'is_approved'}),
+    ProfileUpdateRequest: ('pending_profile_updates', {'status'}),
+}
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=ProfileUpdateRequest)
+@receiver(post_delete, sender=ProfileUpdateRequest)
+def update_site_counters(sender, update_fields=None, **kwargs):
+    """Recount the affected superadmin counter when one of its source rows changes"""
+    counter, watched_fields = _COUNTER_SOURCES[sender]
+    # Saves limited to unrelated columns (e.g. last_login) cannot change the count.
+    if update_fields is not None and not watched_fields.intersection(update_fields):
+        return
+    refresh_site_counters(counter)
+
+
+@receiver(post_save, sender=SystemSettings)
+@receiver(post_delete, sender=SystemSettings)
+@receiver(post_save, sender=AdminWallet)
+@receiver(post_delete, sender=AdminWallet)
+@receiver(post_save, sender=GoogleAuthConfig)
+@receiver(post_delete, sender=GoogleAuthConfig)
+def drop_cached_solo(sender, **kwargs):
+    """Forget the cached singleton so the next get_solo() reads the new row"""
+    invalidate_solo(sender)
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+def drop_cached_menus(sender, **kwargs):
+    """Orphan every cached sidebar menu after a MenuItem change"""
+    MenuItem.invalidate_menu_cache()
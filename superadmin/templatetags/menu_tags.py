@@ -5,26 +5,39 @@ from superadmin.models import MenuItem
 register = template.Library()
 
 
-@register.simple_tag
-def role_menu(role):
+def _menu_for(context, role):
+    """MenuItem.for_role(), memoised on the request so repeated tags on a page hit the cache once"""
+    request = context.get('request')
+    memo = getattr(request, '_menu_cache', None)
+    if memo is None:
+        memo = {}
+        if request is not None:
+            request._menu_cache = memo
+    if role not in memo:
+        memo[role] = MenuItem.for_role(role)
+    return memo[role]
+
+
+@register.simple_tag(takes_context=True)
+def role_menu(context, role):
     """
     Return ordered, active menu items for the given role.
     Welcome is always seeded and fixed at position 0 by defaults.
     """
     try:
-        return MenuItem.ordered_for_role(role)
+        return _menu_for(context, role)
     except Exception:
         return []
 
 
-@register.simple_tag
-def user_menu(user):
+@register.simple_tag(takes_context=True)
+def user_menu(context, user):
     """Shortcut to fetch menu for the current user role."""
     role = getattr(user, "role", None)
     if not role:
         return []
     try:
-        return MenuItem.ordered_for_role(role)
+        return _menu_for(context, role)
     except Exception:
         return []
 
@@ -32,6 +45,7 @@ def user_menu(user):
 @register.filter
 def get_item(mapping, key):
     """Template helper to get dict item by key safely."""
-    if not isinstance(mapping, dict):
+    try:
+        return mapping[key]
+    except (KeyError, IndexError, TypeError, AttributeError):
         return None
-    return mapping.get(key)
@@ -1,3 +1,57 @@
-from django.test import TestCase
+import csv
+import io
+import zipfile
 
-# Create your tests here.
+from django.test import TestCase, TransactionTestCase
+
+from accounts.models import User
+from profiles.models import Profile
+from superadmin.forms import UserCreateForm
+from superadmin.services import generate_backup_export, get_exportable_model_metadata
+
+
+class BulkCreateWithPasswordsTests(TestCase):
+    def test_creates_profiles_and_unique_employee_ids(self):
+        existing = User.objects.create_user(
+            email='existing@example.com', password='x', first_name='Asha', last_name='Rao',
+            role=User.ROLE_MARKETING, is_approved=True,
+        )
+        rows = [
+            {'email': f'user{n}@example.com', 'first_name': 'Arun', 'last_name': 'Roy', 'role': 'marketing'}
+            for n in range(3)
+        ]
+
+        created = UserCreateForm.bulk_create_with_passwords(rows)
+
+        self.assertEqual(len(created), 3)
+        users = [user for user, _ in created]
+        self.assertTrue(all(user.pk for user in users))
+        self.assertEqual(Profile.objects.filter(user__in=users).count(), 3)
+        employee_ids = {user.employee_id for user in users} | {existing.employee_id}
+        self.assertEqual(len(employee_ids), 4)
+        for user, password in created:
+            self.assertTrue(User.objects.get(pk=user.pk).check_password(password))
+
+
+class BackupExportTests(TransactionTestCase):
+    # Tables are rendered on worker threads with their own connections, so the
+    # rows must be committed rather than held in a test transaction.
+
+    def test_csv_export_writes_a_zip_of_tables(self):
+        User.objects.create_user(
+            email='export@example.com', password='x', first_name='Élise', last_name='Roy',
+            role=User.ROLE_MARKETING,
+        )
+        metadata_map = {meta['key']: meta for meta in get_exportable_model_metadata()}
+
+        result = generate_backup_export(['accounts.User'], 'csv', metadata_map)
+
+        with result.content as content, zipfile.ZipFile(content) as archive:
+            [member] = archive.namelist()
+            rows = list(csv.reader(io.TextIOWrapper(archive.open(member), encoding='utf-8', newline='')))
+        self.assertEqual(result.content_type, 'application/zip')
+        self.assertIn('email', rows[0])
+        email_column = rows[0].index('email')
+        self.assertIn(['export@example.com', 'Élise'], [
+            [row[email_column], row[rows[0].index('first_name')]] for row in rows[1:]
+        ])
@@ -6,10 +6,12 @@ from ai_pipeline.models import FullContent, GeneratedContent, JobStructure, JobS
 from ai_pipeline.utils import sync_job_status
 from datetime import datetime, timedelta
 from django.core.paginator import Paginator
-from django.http import HttpResponse, JsonResponse
+from django.http import FileResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
+from django.views.decorators.cache import cache_page
 from django.views.decorators.http import require_POST
+from django.views.decorators.vary import vary_on_cookie
 from jobs.models import Job, JobReworkRequest, ReworkGeneration
 from form_management.models import FormDefinition
 from tickets.models import Ticket, CustomerTicket
@@ -79,6 +81,19 @@ After executing the rework, you must always output the FULL final content, inclu
 """.strip()
 
 
+VIEW_CACHE_TIMEOUT = getattr(settings, 'VIEW_CACHE_TIMEOUT', 60)
+
+
+def _cached_report(timeout=VIEW_CACHE_TIMEOUT):
+    """Cache a read-only report page's GET responses, keyed by URL (query string included) and cookies"""
+    # Apply below login_required/superadmin_required so a cache hit is still
+    # only served to a user who passes them. vary_on_cookie keys the cache per
+    # session, and only 200 responses are stored, so redirects are not.
+    def decorator(view):
+        return cache_page(timeout)(vary_on_cookie(view))
+    return decorator
+
+
 def _parse_date_param(value):
     try:
         return datetime.strptime(value, '%Y-%m-%d').date()
@@ -444,9 +459,12 @@ def backup_center_view(request):
                 description=f'Exported backup (format={form.cleaned_data["export_format"]}, tables={len(selected_keys)})',
                 request=request,
             )
-            response = HttpResponse(result.content, content_type=result.content_type)
-            response['Content-Disposition'] = f'attachment; filename="{result.filename}"'
-            return response
+            return FileResponse(
+                result.content,
+                as_attachment=True,
+                filename=result.filename,
+                content_type=result.content_type,
+            )
 
     status_filter = getattr(form, 'selected_status', None)
     filtered_metadata = [
@@ -539,6 +557,7 @@ def dashboard_view(request):
 
 @login_required
 @superadmin_required
+@_cached_report()
 def statistics_view(request):
     """SuperAdmin-only reporting hub with aggregated performance metrics."""
     now = timezone.now()
@@ -1603,7 +1622,8 @@ def approve_all_job_content(request, job_id):
 @superadmin_required
 def settings_view(request):
     """Control panel for global defaults managed only by Super Admin."""
-    settings_obj = SystemSettings.get_solo()
+    # form.save() writes every column, so start from the live row.
+    settings_obj = SystemSettings.get_solo(cached=False)
     form = SystemSettingsForm(instance=settings_obj)
     updated_fields = []
 
@@ -1916,6 +1936,7 @@ def activity_tracking_view(request):
 
 @login_required
 @superadmin_required
+@_cached_report(VIEW_CACHE_TIMEOUT * 5)
 def activity_analytics_view(request):
     """
     Aggregate active/idle viewing time captured from the JS tracker.
@@ -2709,9 +2730,10 @@ def customer_accounts(request):
 def customer_wallets(request):
     success_message = None
     error_message = None
-    from superadmin.models import SystemSettings, AdminWallet, CoinWallet, CoinTransaction, _generate_bigint_id
-    settings_obj = SystemSettings.get_solo()
-    admin_wallet = AdminWallet.get_solo()
+    from superadmin.models import SystemSettings, AdminWallet, CoinWallet, CoinTransaction
+    # Balances are read-modify-written below, so bypass the singleton cache.
+    settings_obj = SystemSettings.get_solo(cached=False)
+    admin_wallet = AdminWallet.get_solo(cached=False)
     # Keep settings counters in sync with AdminWallet singleton and reconcile against customer balances
     try:
         # Ensure admin totals mirror the singleton
@@ -2740,11 +2762,9 @@ def customer_wallets(request):
             if create_amount is None:
                 error_message = 'Enter a positive amount to create coins.'
             else:
-                settings_obj.admin_coin_total_created += create_amount
-                settings_obj.admin_coin_balance += create_amount
-                admin_wallet.total_created += create_amount
-                admin_wallet.balance += create_amount
-                admin_wallet.save(update_fields=['total_created', 'balance', 'updated_at'])
+                admin_wallet.credit(create_amount, minted=True)
+                settings_obj.admin_coin_total_created = admin_wallet.total_created
+                settings_obj.admin_coin_balance = admin_wallet.balance
                 settings_obj.save(update_fields=['admin_coin_total_created', 'admin_coin_balance', 'updated_at'])
                 success_message = f"Created {create_amount} coins. Admin balance is now {settings_obj.admin_coin_balance}."
         else:
@@ -2768,44 +2788,25 @@ def customer_wallets(request):
                 if not user_wallet:
                     error_message = 'Customer wallet not found.'
                 else:
-                    # Apply balance change directly to profile (simple implementation).
-                    new_balance = user_wallet.balance
                     customer_user = user_wallet.user
-                    # ensure admin_balance sufficient
+                    txn_type = CoinTransaction.TYPE_CREDIT if action == 'CREDIT' else CoinTransaction.TYPE_DEBIT
+                    # Both wallets move through conditional F() updates, so a
+                    # concurrent transfer cannot spend the same coins twice.
                     if action == 'CREDIT':
-                        if amount_val > admin_wallet.balance:
+                        if not admin_wallet.debit(amount_val):
                             error_message = 'Insufficient admin coin balance to transfer.'
-                        else:
-                            admin_wallet.balance -= amount_val
-                            settings_obj.admin_coin_balance -= amount_val
-                            new_balance += amount_val
-                    else:
-                        if amount_val > user_wallet.balance:
-                            error_message = 'Insufficient balance to deduct that amount.'
-                        else:
-                            new_balance -= amount_val
-                            admin_wallet.balance += amount_val
-                            settings_obj.admin_coin_balance += amount_val
+                    elif amount_val > user_wallet.balance:
+                        error_message = 'Insufficient balance to deduct that amount.'
                     if not error_message:
-                        before_balance = user_wallet.balance
-                        user_wallet.balance = new_balance
-                        user_wallet.status = CoinWallet.STATUS_ACTIVE if new_balance >= 0 else CoinWallet.STATUS_FROZEN
-                        user_wallet.save()
-                        admin_wallet.save(update_fields=['balance', 'total_created', 'updated_at'])
-                        settings_obj.save(update_fields=['admin_coin_balance', 'admin_coin_total_created', 'updated_at'])
                         # compute expiry one year from now
                         from datetime import timedelta
                         expiry_dt = timezone.now() + timedelta(days=365)
-                        # log transaction
-                        CoinTransaction.objects.create(
-                            txn_id=f"TXN{_generate_bigint_id()}",
-                            wallet=user_wallet,
-                            customer=customer_user,
-                            txn_type=CoinTransaction.TYPE_CREDIT if action == 'CREDIT' else CoinTransaction.TYPE_DEBIT,
+                        # update the balance and log the transaction together
+                        txn = user_wallet.apply_transaction(
+                            txn_type=txn_type,
                             amount=amount_val,
-                            before_balance=before_balance,
-                            after_balance=new_balance,
                             source=CoinTransaction.SOURCE_ADMIN,
+                            customer=customer_user,
                             related_object_type=None,
                             related_object_id=None,
                             reason=note or '',
@@ -2813,6 +2814,18 @@ def customer_wallets(request):
                             created_by_role='SUPERADMIN',
                             created_by_id=request.user,
                         )
+                        if txn is None:
+                            # The wallet was debited concurrently.
+                            error_message = 'Insufficient balance to deduct that amount.'
+                        elif action != 'CREDIT':
+                            admin_wallet.credit(amount_val)
+                    if not error_message:
+                        new_balance = user_wallet.balance
+                        if user_wallet.status != CoinWallet.STATUS_ACTIVE:
+                            user_wallet.status = CoinWallet.STATUS_ACTIVE
+                            user_wallet.save(update_fields=['status', 'last_updated_at'])
+                        settings_obj.admin_coin_balance = admin_wallet.balance
+                        settings_obj.save(update_fields=['admin_coin_balance', 'updated_at'])
                         success_message = f"{'Credited' if action == 'CREDIT' else 'Debited'} {amount_val} coins for {getattr(customer_user, 'employee_id', '') or customer_user.email}. New balance: {new_balance}."
 
     # Ensure each customer has a wallet
@@ -3087,7 +3100,7 @@ def customer_ai_logs(request):
 @login_required
 @superadmin_required
 def customer_job_checks(request):
-    submissions = JobCheckingSubmission.objects.select_related('user').all()
+    submissions = JobCheckingSubmission.objects.list_qs().select_related('user')
     rule_defs = [
         ('REMOVE_AI', 'Remove-AI'),
         ('JOB_CHECK', 'Job Checking'),
@@ -3179,7 +3192,7 @@ def customer_job_check_detail(request, submission_id):
 @login_required
 @superadmin_required
 def customer_structures(request):
-    submissions = StructureGenerationSubmission.objects.select_related('user').all()
+    submissions = StructureGenerationSubmission.objects.list_qs().select_related('user')
     search = (request.GET.get('search') or '').strip().lower()
     status_filter = (request.GET.get('status') or '').strip().upper()
     date_from = _parse_date_param(request.GET.get('date_from'))
@@ -3280,7 +3293,7 @@ def customer_structure_detail(request, submission_id):
 @login_required
 @superadmin_required
 def customer_contents(request):
-    submissions = ContentGenerationSubmission.objects.select_related('user').all()
+    submissions = ContentGenerationSubmission.objects.list_qs().select_related('user')
     search = (request.GET.get('search') or '').strip().lower()
     status_filter = (request.GET.get('status') or '').strip().upper()
     date_from = _parse_date_param(request.GET.get('date_from'))
@@ -3556,6 +3569,7 @@ def customer_bookings(request):
 
 @login_required
 @superadmin_required
+@_cached_report(VIEW_CACHE_TIMEOUT * 5)
 def customer_analytics(request):
     # Date filters
     date_from = _parse_date_param(request.GET.get('date_from'))
@@ -3579,15 +3593,15 @@ def customer_analytics(request):
     if date_from or date_to:
         ai_logs = [l for l in ai_logs if _in_range(l.created_at)]
 
-    job_checks = JobCheckingSubmission.objects.all()
+    job_checks = JobCheckingSubmission.objects.list_qs()
     if date_from or date_to:
         job_checks = [j for j in job_checks if _in_range(j.created_at)]
 
-    structures = StructureGenerationSubmission.objects.all()
+    structures = StructureGenerationSubmission.objects.list_qs()
     if date_from or date_to:
         structures = [s for s in structures if _in_range(s.created_at)]
 
-    contents = ContentGenerationSubmission.objects.all()
+    contents = ContentGenerationSubmission.objects.list_qs()
     if date_from or date_to:
         contents = [c for c in contents if _in_range(c.created_at)]
 